@@ -1,27 +1,25 @@
 """CLI interface for Homo Ludens."""
 
+import asyncio
+import atexit
+import heapq
 import os
 import webbrowser
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 
 import typer
 from dotenv import load_dotenv, set_key
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.prompt import Prompt
 
 from homo_ludens.models import Platform
-from homo_ludens.recommender import Recommender
-from homo_ludens.steam import SteamAPIError, SteamClient
-from homo_ludens.psn import PSNAPIError, PSNClient
-from homo_ludens.xbox import XboxAPIError, XboxClient
 from homo_ludens.storage import Storage
 
-# Load .env file - try current directory, then home directory
 ENV_FILE = Path.home() / ".homo_ludens" / ".env"
-load_dotenv(Path.cwd() / ".env")
-load_dotenv(ENV_FILE)
 
 app = typer.Typer(
     name="homo-ludens",
@@ -33,48 +31,153 @@ console = Console()
 # Default minimum playtime for achievement fetching (in minutes)
 DEFAULT_ACHIEVEMENT_MIN_PLAYTIME = 60
 
+# Chat inputs that end the conversation
+EXIT_COMMANDS = frozenset({"quit", "exit"})
+
+
+_env_loaded = False
+
+
+def _ensure_env_loaded() -> None:
+    """Load .env files on first use - current directory, then home directory.
+
+    Only commands that read credentials call this, so --help and commands
+    like clear don't pay for parsing the env files.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    load_dotenv(Path.cwd() / ".env")
+    load_dotenv(ENV_FILE)
+    _env_loaded = True
+
+
+def _get_recommender():
+    """Import and construct the recommender on first use.
+
+    The OpenAI SDK is by far the slowest import in the CLI, so commands that
+    never talk to the LLM should not pay for it.
+    """
+    from homo_ludens.recommender import Recommender
+
+    return Recommender()
+
+
+def _enrich_with_progress(client, *jobs: tuple[str, object, list]) -> None:
+    """Run enrichment jobs concurrently behind one progress bar per job.
+
+    Args:
+        client: SteamClient whose enrich_concurrently runs the jobs.
+        *jobs: (description, enrich, items) triples.
+    """
+    jobs = tuple(job for job in jobs if job[2])
+    if not jobs:
+        return
+    with Progress(console=console, transient=True) as progress:
+        tasks = [progress.add_task(f"[dim]{desc}[/dim]", total=len(items)) for desc, _, items in jobs]
+        asyncio.run(client.enrich_concurrently(
+            *((enrich, items) for _, enrich, items in jobs),
+            on_progress=lambda index, item: progress.advance(tasks[index]),
+        ))
+
+
+def _enable_chat_history(storage: Storage) -> None:
+    """Enable line editing and persistent input history for the chat prompt.
+
+    Uses the stdlib readline module, which input() (and so Prompt.ask) picks
+    up automatically. Not available on every platform, so this is best effort.
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    history_path = storage.data_dir / "chat_history"
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(readline.write_history_file, history_path)
+
+
+def _games_needing_enrichment(games: list, previous_games: list) -> list:
+    """Reuse stored progress for games that haven't been played since the last sync.
+
+    Achievements can only change while playing, so a game whose playtime
+    matches the stored profile keeps its previous progress.
+
+    Args:
+        games: Freshly fetched games (updated in place).
+        previous_games: Games from the stored profile.
+
+    Returns:
+        The games whose achievements still need to be fetched.
+    """
+    previous = {g.id: g for g in previous_games if g.progress is not None}
+    stale = []
+    for game in games:
+        prev = previous.get(game.id)
+        if prev is not None and prev.playtime_minutes == game.playtime_minutes:
+            game.progress = prev.progress
+        else:
+            stale.append(game)
+    return stale
+
 
 def _refresh_library(console: Console, storage: Storage, min_playtime: int = DEFAULT_ACHIEVEMENT_MIN_PLAYTIME):
     """Refresh Steam library with achievements and wishlist. Returns updated profile."""
+    from homo_ludens.steam import SteamAPIError, SteamClient
+
     console.print("[bold blue]Refreshing Steam library...[/bold blue]")
     
     try:
-        client = SteamClient()
+        client = SteamClient(cache=storage.cache)
         games = client.get_owned_games()
+        profile = storage.load_profile()
         
-        # Fetch achievements for played games
+        # Fetch achievements for played games that changed since the last sync
         played_games = [g for g in games if g.playtime_minutes >= min_playtime]
-        console.print(f"[dim]Fetching achievements for {len(played_games)} games...[/dim]")
-        
-        with console.status("[dim]Fetching achievements...[/dim]") as status:
-            for i, game in enumerate(played_games):
-                status.update(f"[dim]{i+1}/{len(played_games)} - {game.name}[/dim]")
-                client.enrich_game_with_achievements(game)
+        stale_games = _games_needing_enrichment(played_games, profile.games)
+        console.print(
+            f"[dim]Fetching achievements for {len(stale_games)} games "
+            f"({len(played_games) - len(stale_games)} unchanged)...[/dim]"
+        )
         
         # Fetch wishlist
         console.print("[dim]Fetching wishlist...[/dim]")
         wishlist_items = client.get_wishlist()
-        with console.status("[dim]Fetching wishlist details...[/dim]") as status:
-            for i, item in enumerate(wishlist_items):
-                status.update(f"[dim]{i+1}/{len(wishlist_items)}[/dim]")
-                client.enrich_wishlist_item(item)
+
+        # Achievements and wishlist details are fetched together; prices are
+        # then looked up in batches rather than with each item's details
+        _enrich_with_progress(
+            client,
+            (
+                "Fetching achievements...",
+                # Bulk sync skips rarity lookups for games with nothing unlocked
+                partial(client.enrich_game_with_achievements_async, rarity_for_locked=False),
+                stale_games,
+            ),
+            (
+                "Fetching wishlist details...",
+                partial(client.enrich_wishlist_item_async, fetch_price=False),
+                wishlist_items,
+            ),
+        )
+        client.apply_wishlist_prices(wishlist_items)
         
-        profile = storage.load_profile()
         profile.games = games
         profile.wishlist = wishlist_items
         profile.steam_id = client.steam_id
         storage.save_profile(profile)
         
-        games_with_achievements = [
-            g for g in games 
-            if g.progress and g.progress.total > 0
-        ]
-        on_sale = [item for item in wishlist_items if item.is_on_sale]
+        games_with_achievements = sum(1 for g in games if g.has_progress)
+        on_sale_count = sum(1 for item in wishlist_items if item.is_on_sale)
         
         console.print(
             f"[bold green]Done![/bold green] {len(games)} games, "
-            f"{len(games_with_achievements)} with achievements, "
-            f"{len(wishlist_items)} wishlist items ({len(on_sale)} on sale)."
+            f"{games_with_achievements} with achievements, "
+            f"{len(wishlist_items)} wishlist items ({on_sale_count} on sale)."
         )
         return profile
         
@@ -87,34 +190,23 @@ def _show_status(console: Console, profile):
     """Show library status inline."""
     console.print("[bold]Library Status:[/bold]")
     
-    # Count by platform
-    steam_games = [g for g in profile.games if g.platform == Platform.STEAM]
-    psn_games = [g for g in profile.games if g.platform == Platform.PLAYSTATION]
-    xbox_games = [g for g in profile.games if g.platform == Platform.XBOX]
+    stats = profile.library_stats()
+    console.print(f"  Total games: {stats.total_games}")
+    if stats.steam_games:
+        console.print(f"    Steam: {stats.steam_games}")
+    if stats.psn_games:
+        console.print(f"    PlayStation: {stats.psn_games}")
+    if stats.xbox_games:
+        console.print(f"    Xbox: {stats.xbox_games}")
     
-    console.print(f"  Total games: {len(profile.games)}")
-    if steam_games:
-        console.print(f"    Steam: {len(steam_games)}")
-    if psn_games:
-        console.print(f"    PlayStation: {len(psn_games)}")
-    if xbox_games:
-        console.print(f"    Xbox: {len(xbox_games)}")
-    
-    if profile.games:
-        total_playtime = sum(g.playtime_minutes for g in profile.games)
-        played = len([g for g in profile.games if g.playtime_minutes > 0])
-        games_with_ach = len([
-            g for g in profile.games 
-            if g.progress and g.progress.total > 0
-        ])
-        
-        console.print(f"  Playtime: {total_playtime // 60} hours")
-        console.print(f"  Played: {played}/{len(profile.games)}")
-        console.print(f"  With achievements/trophies: {games_with_ach}")
+    if stats.total_games:
+        console.print(f"  Playtime: {stats.total_playtime_minutes // 60} hours")
+        console.print(f"  Played: {stats.games_with_playtime}/{stats.total_games}")
+        console.print(f"  With achievements/trophies: {stats.games_with_progress}")
     
     if profile.wishlist:
-        on_sale = [item for item in profile.wishlist if item.is_on_sale]
-        console.print(f"  Wishlist: {len(profile.wishlist)} items ({len(on_sale)} on sale)")
+        on_sale_count = sum(1 for item in profile.wishlist if item.is_on_sale)
+        console.print(f"  Wishlist: {len(profile.wishlist)} items ({on_sale_count} on sale)")
 
 
 def _show_platform_details(console: Console, profile, steam: bool = False, psn: bool = False, xbox: bool = False):
@@ -129,8 +221,9 @@ def _show_platform_details(console: Console, profile, steam: bool = False, psn:
     if xbox:
         platforms_to_show.append(("Xbox", Platform.XBOX, "achievements"))
     
+    by_platform = profile.games_by_platform()
     for platform_name, platform_enum, ach_word in platforms_to_show:
-        games = [g for g in profile.games if g.platform == platform_enum]
+        games = by_platform[platform_enum]
         
         if not games:
             console.print(f"\n[yellow]No {platform_name} games found. Run sync command first.[/yellow]")
@@ -153,7 +246,7 @@ def _show_platform_details(console: Console, profile, steam: bool = False, psn:
             console.print("[dim]Playtime: not available from Xbox API[/dim]")
         
         # Achievement/trophy stats
-        games_with_ach = [g for g in games if g.progress and g.progress.total > 0]
+        games_with_ach = [g for g in games if g.has_progress]
         if games_with_ach:
             total_ach = sum(g.progress.total for g in games_with_ach if g.progress)
             unlocked_ach = sum(g.progress.unlocked for g in games_with_ach if g.progress)
@@ -165,23 +258,19 @@ def _show_platform_details(console: Console, profile, steam: bool = False, psn:
             console.print(f"  100% completed: {len(completed)}")
         
         # Top played games
-        top_played = sorted(games, key=lambda g: g.playtime_minutes, reverse=True)[:5]
+        top_played = heapq.nlargest(5, games, key=attrgetter("playtime_minutes"))
         if top_played and top_played[0].playtime_minutes > 0:
             console.print(f"\n[bold]Most Played:[/bold]")
             for i, game in enumerate(top_played, 1):
                 hours = game.playtime_minutes // 60
                 ach_str = ""
-                if game.progress and game.progress.total > 0:
+                if game.has_progress:
                     ach_str = f" ({game.progress.completion_percent}% {ach_word})"
                 console.print(f"  {i}. {game.name} - {hours}h{ach_str}")
         
         # Highest achievement completion
         if games_with_ach:
-            top_completion = sorted(
-                games_with_ach, 
-                key=lambda g: g.progress.completion_percent if g.progress else 0, 
-                reverse=True
-            )[:5]
+            top_completion = heapq.nlargest(5, games_with_ach, key=attrgetter("completion_percent"))
             console.print(f"\n[bold]Highest {ach_word.title()} Completion:[/bold]")
             for i, game in enumerate(top_completion, 1):
                 if game.progress:
@@ -193,7 +282,7 @@ def _show_platform_details(console: Console, profile, steam: bool = False, psn:
         # Recently played (if available)
         recent = [g for g in games if g.last_played]
         if recent:
-            recent = sorted(recent, key=lambda g: g.last_played or g.last_played, reverse=True)[:5]
+            recent = heapq.nlargest(5, recent, key=attrgetter("last_played"))
             console.print(f"\n[bold]Recently Played:[/bold]")
             for i, game in enumerate(recent, 1):
                 if game.last_played:
@@ -223,53 +312,71 @@ def sync(
     ),
 ):
     """Sync your Steam library."""
+    from homo_ludens.steam import SteamAPIError, SteamClient
+
+    _ensure_env_loaded()
+
     storage = Storage()
     profile = storage.load_profile()
 
     console.print("[bold blue]Syncing Steam library...[/bold blue]")
 
     try:
-        client = SteamClient()
+        client = SteamClient(cache=storage.cache)
         games = client.get_owned_games()
 
         console.print(
             f"[bold green]Success![/bold green] Synced {len(games)} games from Steam."
         )
 
-        # Fetch achievements if requested
+        # Collect the enrichment work, then run achievements and wishlist together
+        jobs = []
         if achievements:
             played_games = [g for g in games if g.playtime_minutes >= min_playtime]
+            stale_games = _games_needing_enrichment(played_games, profile.games)
             console.print(
-                f"\n[bold blue]Fetching achievements for {len(played_games)} games "
-                f"(with >= {min_playtime} min playtime)...[/bold blue]"
+                f"\n[bold blue]Fetching achievements for {len(stale_games)} games "
+                f"(with >= {min_playtime} min playtime, "
+                f"{len(played_games) - len(stale_games)} unchanged)...[/bold blue]"
             )
-            
-            with console.status("[dim]Fetching achievements...[/dim]") as status:
-                for i, game in enumerate(played_games):
-                    status.update(f"[dim]Fetching achievements... {i+1}/{len(played_games)} - {game.name}[/dim]")
-                    client.enrich_game_with_achievements(game)
-            
+            jobs.append(
+                (
+                    "Fetching achievements...",
+                    # Bulk sync skips rarity lookups for games with nothing unlocked
+                    partial(client.enrich_game_with_achievements_async, rarity_for_locked=False),
+                    stale_games,
+                )
+            )
+
+        wishlist_items = []
+        if wishlist:
+            console.print("\n[bold blue]Fetching wishlist...[/bold blue]")
+            wishlist_items = client.get_wishlist()
+            jobs.append(
+                (
+                    "Fetching wishlist details...",
+                    partial(client.enrich_wishlist_item_async, fetch_price=False),
+                    wishlist_items,
+                )
+            )
+
+        _enrich_with_progress(client, *jobs)
+        if wishlist_items:
+            # Prices are looked up in batches rather than with each item's details
+            client.apply_wishlist_prices(wishlist_items)
+
+        if achievements:
             # Count games with achievements
             games_with_achievements = [
                 g for g in games 
-                if g.progress and g.progress.total > 0
+                if g.has_progress
             ]
             console.print(
                 f"[green]Fetched achievements for {len(games_with_achievements)} games.[/green]"
             )
 
-        # Fetch wishlist
-        wishlist_items = []
         if wishlist:
-            console.print("\n[bold blue]Fetching wishlist...[/bold blue]")
-            wishlist_items = client.get_wishlist()
-            
             if wishlist_items:
-                with console.status("[dim]Fetching wishlist details and prices...[/dim]") as status:
-                    for i, item in enumerate(wishlist_items):
-                        status.update(f"[dim]{i+1}/{len(wishlist_items)} - App {item.app_id}[/dim]")
-                        client.enrich_wishlist_item(item)
-                
                 on_sale = [item for item in wishlist_items if item.is_on_sale]
                 console.print(
                     f"[green]Fetched {len(wishlist_items)} wishlist items, "
@@ -294,13 +401,13 @@ def sync(
         storage.save_profile(profile)
 
         # Show top 5 by playtime
-        top_games = sorted(games, key=lambda g: g.playtime_minutes, reverse=True)[:5]
+        top_games = heapq.nlargest(5, games, key=attrgetter("playtime_minutes"))
         if top_games:
             console.print("\n[bold]Your most played games:[/bold]")
             for i, game in enumerate(top_games, 1):
                 hours = game.playtime_minutes // 60
                 ach_str = ""
-                if game.progress and game.progress.total > 0:
+                if game.has_progress:
                     ach_str = f" - {game.progress.completion_percent}% achievements"
                 console.print(f"  {i}. {game.name} ({hours}h){ach_str}")
 
@@ -312,11 +419,15 @@ def sync(
 @app.command("sync-psn")
 def sync_psn():
     """Sync your PlayStation library."""
+    from homo_ludens.psn import PSNAPIError, PSNClient
+
+    _ensure_env_loaded()
     storage = Storage()
     profile = storage.load_profile()
 
     # Check if PSN token is configured
-    if not os.getenv("PSN_NPSSO_TOKEN"):
+    npsso_token = os.environ.get("PSN_NPSSO_TOKEN")
+    if not npsso_token:
         console.print(
             "[yellow]PSN not configured. Run 'homo-ludens config --psn' to set up.[/yellow]"
         )
@@ -325,7 +436,7 @@ def sync_psn():
     console.print("[bold blue]Syncing PlayStation library...[/bold blue]")
 
     try:
-        client = PSNClient()
+        client = PSNClient(npsso_token=npsso_token, cache=storage.cache)
         console.print(f"[dim]Logged in as: {client.online_id}[/dim]")
         
         with console.status("[dim]Fetching games and trophies...[/dim]"):
@@ -342,18 +453,15 @@ def sync_psn():
         storage.save_profile(profile)
 
         # Show games with highest trophy completion
-        games_with_trophies = [
-            g for g in games 
-            if g.progress and g.progress.total > 0
-        ]
-        games_with_trophies.sort(
-            key=lambda g: g.progress.completion_percent if g.progress else 0, 
-            reverse=True
+        games_with_trophies = heapq.nlargest(
+            5,
+            (g for g in games if g.has_progress),
+            key=attrgetter("completion_percent"),
         )
 
         if games_with_trophies:
             console.print("\n[bold]Your top trophy games:[/bold]")
-            for i, game in enumerate(games_with_trophies[:5], 1):
+            for i, game in enumerate(games_with_trophies, 1):
                 if game.progress:
                     console.print(
                         f"  {i}. {game.name} - {game.progress.completion_percent}% "
@@ -368,11 +476,15 @@ def sync_psn():
 @app.command("sync-xbox")
 def sync_xbox():
     """Sync your Xbox library."""
+    from homo_ludens.xbox import XboxAPIError, XboxClient
+
+    _ensure_env_loaded()
     storage = Storage()
     profile = storage.load_profile()
 
     # Check if Xbox API key is configured
-    if not os.getenv("OPENXBL_API_KEY"):
+    xbox_key = os.environ.get("OPENXBL_API_KEY")
+    if not xbox_key:
         console.print(
             "[yellow]Xbox not configured. Run 'homo-ludens config --xbox' to set up.[/yellow]"
         )
@@ -381,7 +493,7 @@ def sync_xbox():
     console.print("[bold blue]Syncing Xbox library...[/bold blue]")
 
     try:
-        client = XboxClient()
+        client = XboxClient(api_key=xbox_key)
         console.print(f"[dim]Logged in as: {client.gamertag}[/dim]")
         
         with console.status("[dim]Fetching games and achievements...[/dim]"):
@@ -398,18 +510,15 @@ def sync_xbox():
         storage.save_profile(profile)
 
         # Show games with highest achievement completion
-        games_with_achievements = [
-            g for g in games 
-            if g.progress and g.progress.total > 0
-        ]
-        games_with_achievements.sort(
-            key=lambda g: g.progress.completion_percent if g.progress else 0, 
-            reverse=True
+        games_with_achievements = heapq.nlargest(
+            5,
+            (g for g in games if g.has_progress),
+            key=attrgetter("completion_percent"),
         )
 
         if games_with_achievements:
             console.print("\n[bold]Your top achievement games:[/bold]")
-            for i, game in enumerate(games_with_achievements[:5], 1):
+            for i, game in enumerate(games_with_achievements, 1):
                 if game.progress:
                     console.print(
                         f"  {i}. {game.name} - {game.progress.completion_percent}% "
@@ -430,12 +539,14 @@ def config(
 ):
     """Configure platform connections."""
     if show:
+        _ensure_env_loaded()
         console.print(Panel("[bold]Current Configuration[/bold]", style="blue"))
         
-        steam_key = os.getenv("STEAM_API_KEY")
-        steam_id = os.getenv("STEAM_ID")
-        psn_token = os.getenv("PSN_NPSSO_TOKEN")
-        xbox_key = os.getenv("OPENXBL_API_KEY")
+        env = os.environ
+        steam_key = env.get("STEAM_API_KEY")
+        steam_id = env.get("STEAM_ID")
+        psn_token = env.get("PSN_NPSSO_TOKEN")
+        xbox_key = env.get("OPENXBL_API_KEY")
         
         if steam_key:
             console.print(f"Steam API Key: [green]configured[/green] ({steam_key[:8]}...)")
@@ -550,9 +661,17 @@ def config(
 @app.command()
 def chat():
     """Start a conversation with your game companion."""
+    # Markdown pulls in markdown-it; only chat renders it
+    from rich.live import Live
+    from rich.markdown import Markdown
+
+    _ensure_env_loaded()
     storage = Storage()
     profile = storage.load_profile()
     history = storage.load_conversation()
+    # Messages are appended to a log during the session; fold them into the snapshot on exit
+    atexit.register(storage.compact_conversation)
+    _enable_chat_history(storage)
 
     if not profile.games:
         console.print(
@@ -560,11 +679,8 @@ def chat():
             "or I can still chat without your library data.[/yellow]\n"
         )
 
-    try:
-        recommender = Recommender()
-    except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(1)
+    # Created on the first message sent to the LLM
+    recommender = None
 
     console.print(
         Panel(
@@ -585,8 +701,7 @@ def chat():
             "What's on your mind?"
         )
         console.print(f"\n[bold cyan]Companion:[/bold cyan] {greeting}\n")
-        history.add_message("assistant", greeting)
-        storage.save_conversation(history)
+        storage.append_message(history.add_message("assistant", greeting))
 
     while True:
         try:
@@ -595,44 +710,67 @@ def chat():
             console.print("\n[dim]Goodbye![/dim]")
             break
 
-        if not user_input.strip():
+        cmd = user_input.strip().lower()
+        if not cmd:
             continue
 
-        if user_input.lower() in ("quit", "exit"):
+        if cmd in EXIT_COMMANDS:
             console.print("[dim]Goodbye! Happy gaming![/dim]")
             break
 
-        if user_input.lower() == "clear":
+        if cmd == "clear":
             storage.clear_conversation()
             history = storage.load_conversation()
             console.print("[dim]Conversation cleared.[/dim]\n")
             continue
 
-        if user_input.lower() == "/refresh":
+        if cmd == "/refresh":
             profile = _refresh_library(console, storage)
             console.print()
             continue
 
-        if user_input.lower() == "/status":
+        if cmd == "/status":
             _show_status(console, profile)
             console.print()
             continue
 
-        # Get response from LLM
+        # Get response from LLM, keeping the spinner up until the first token arrives
         with console.status("[dim]Thinking...[/dim]"):
+            if recommender is None:
+                try:
+                    recommender = _get_recommender()
+                except ValueError as e:
+                    console.print(f"[bold red]Error:[/bold red] {e}")
+                    raise typer.Exit(1)
             try:
-                response = recommender.chat(user_input, profile, history)
+                stream = recommender.chat_stream(user_input, profile, history)
+                chunks = [next(stream, "")]
+            except KeyboardInterrupt:
+                console.print("[dim](request cancelled)[/dim]\n")
+                continue
             except Exception as e:
                 console.print(f"[bold red]Error:[/bold red] {e}")
                 continue
 
+        console.print(f"\n[bold cyan]Companion:[/bold cyan]")
+        try:
+            with Live(Markdown(chunks[0]), console=console, refresh_per_second=8) as live:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    live.update(Markdown("".join(chunks)))
+        except KeyboardInterrupt:
+            # Ctrl+C stops generation early; keep the part that already arrived
+            stream.close()
+            console.print("[dim](response interrupted)[/dim]")
+        except Exception as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            continue
+        response = "".join(chunks)
+
         # Update history
-        history.add_message("user", user_input)
-        history.add_message("assistant", response)
-        storage.save_conversation(history)
+        storage.append_message(history.add_message("user", user_input))
+        storage.append_message(history.add_message("assistant", response))
 
-        console.print(f"\n[bold cyan]Companion:[/bold cyan]")
-        console.print(Markdown(response))
         console.print()
 
 
@@ -670,29 +808,23 @@ def status(
         console.print("Xbox: [yellow]not connected[/yellow]")
 
     # Game stats by platform
-    steam_games = [g for g in profile.games if g.platform == Platform.STEAM]
-    psn_games = [g for g in profile.games if g.platform == Platform.PLAYSTATION]
-    xbox_games = [g for g in profile.games if g.platform == Platform.XBOX]
-    
-    console.print(f"\nGames in library: {len(profile.games)}")
-    if steam_games:
-        console.print(f"  Steam: {len(steam_games)}")
-    if psn_games:
-        console.print(f"  PlayStation: {len(psn_games)}")
-    if xbox_games:
-        console.print(f"  Xbox: {len(xbox_games)}")
-
-    if profile.games:
-        total_playtime = sum(g.playtime_minutes for g in profile.games)
-        console.print(f"Total playtime: {total_playtime // 60} hours")
-
-        played = len([g for g in profile.games if g.playtime_minutes > 0])
-        console.print(f"Games played: {played}/{len(profile.games)}")
+    stats = profile.library_stats()
+    console.print(f"\nGames in library: {stats.total_games}")
+    if stats.steam_games:
+        console.print(f"  Steam: {stats.steam_games}")
+    if stats.psn_games:
+        console.print(f"  PlayStation: {stats.psn_games}")
+    if stats.xbox_games:
+        console.print(f"  Xbox: {stats.xbox_games}")
+
+    if stats.total_games:
+        console.print(f"Total playtime: {stats.total_playtime_minutes // 60} hours")
+        console.print(f"Games played: {stats.games_with_playtime}/{stats.total_games}")
 
     # Wishlist info
     if profile.wishlist:
-        on_sale = [item for item in profile.wishlist if item.is_on_sale]
-        console.print(f"Wishlist items: {len(profile.wishlist)} ({len(on_sale)} on sale)")
+        on_sale_count = sum(1 for item in profile.wishlist if item.is_on_sale)
+        console.print(f"Wishlist items: {len(profile.wishlist)} ({on_sale_count} on sale)")
 
     history = storage.load_conversation()
     console.print(f"Conversation messages: {len(history.messages)}")
@@ -717,6 +849,9 @@ def web(
 ):
     """Start the web UI server."""
     import uvicorn
+
+    # The web app reads credentials from the environment (inherited by reload workers)
+    _ensure_env_loaded()
     
     console.print(Panel(
         f"[bold]Starting Homo Ludens Web UI[/bold]\n\n"
@@ -11,6 +11,8 @@ from homo_ludens.models.game import (
     ConversationMetadata,
     # Core models
     Game,
+    group_games_by_platform,
+    LibraryStats,
     Platform,
     PlaySession,
     PriceInfo,
@@ -41,6 +43,8 @@ __all__ = [
     "ConversationMetadata",
     # Core models
     "Game",
+    "group_games_by_platform",
+    "LibraryStats",
     "Platform",
     "PlaySession",
     "PriceInfo",
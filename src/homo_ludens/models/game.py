@@ -1,9 +1,11 @@
 """Core data models for games and user profiles."""
 
 import uuid
+from bisect import bisect_left
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -52,20 +54,22 @@ class RarityTier(str, Enum):
     ULTRA_RARE = "ultra_rare"
 
 
+# Upper bounds (inclusive) of each rarity tier, rarest first
+_RARITY_THRESHOLDS = (5, 10, 20, 50)
+_RARITY_TIERS = (
+    RarityTier.ULTRA_RARE,
+    RarityTier.VERY_RARE,
+    RarityTier.RARE,
+    RarityTier.UNCOMMON,
+    RarityTier.COMMON,
+)
+
+
 def percent_to_rarity_tier(percent: float | None) -> RarityTier | None:
     """Convert unlock percentage to rarity tier."""
     if percent is None:
         return None
-    if percent > 50:
-        return RarityTier.COMMON
-    elif percent > 20:
-        return RarityTier.UNCOMMON
-    elif percent > 10:
-        return RarityTier.RARE
-    elif percent > 5:
-        return RarityTier.VERY_RARE
-    else:
-        return RarityTier.ULTRA_RARE
+    return _RARITY_TIERS[bisect_left(_RARITY_THRESHOLDS, percent)]
 
 
 # =============================================================================
@@ -130,6 +134,8 @@ class XboxAchievement(BaseModel):
 # =============================================================================
 # Platform-Specific Progress Stats Classes
 # =============================================================================
+# raw_data holds the API payload for debugging only: it is not validated and
+# is left out of repr and of the saved profile.
 
 
 class SteamProgressStats(BaseModel):
@@ -139,7 +145,7 @@ class SteamProgressStats(BaseModel):
     total: int = 0
     unlocked: int = 0
     achievements: list[SteamAchievement] = Field(default_factory=list)
-    raw_data: dict = Field(default_factory=dict)
+    raw_data: Any = Field(default_factory=dict, exclude=True, repr=False)
 
     @property
     def completion_percent(self) -> float:
@@ -172,7 +178,7 @@ class PlayStationProgressStats(BaseModel):
     platinum_unlocked: int = 0
 
     trophies: list[PlayStationTrophy] = Field(default_factory=list)
-    raw_data: dict = Field(default_factory=dict)
+    raw_data: Any = Field(default_factory=dict, exclude=True, repr=False)
 
     @property
     def completion_percent(self) -> float:
@@ -189,6 +195,7 @@ class PlayStationProgressStats(BaseModel):
     @property
     def display_summary(self) -> str:
         """Human-readable summary with trophy icons. E.g., '🥉12 🥈5 🥇3 🏆'"""
+        pct = self.completion_percent
         parts = []
         if self.bronze_unlocked > 0 or self.bronze_total > 0:
             parts.append(f"🥉{self.bronze_unlocked}")
@@ -199,8 +206,8 @@ class PlayStationProgressStats(BaseModel):
         if self.platinum_total > 0:
             parts.append("🏆" if self.platinum_unlocked > 0 else "")
         if parts:
-            return " ".join(p for p in parts if p) + f" ({self.completion_percent}%)"
-        return f"{self.unlocked}/{self.total} trophies ({self.completion_percent}%)"
+            return " ".join(filter(None, parts)) + f" ({pct}%)"
+        return f"{self.unlocked}/{self.total} trophies ({pct}%)"
 
 
 class XboxProgressStats(BaseModel):
@@ -215,7 +222,7 @@ class XboxProgressStats(BaseModel):
     unlocked_gamerscore: int = 0
 
     achievements: list[XboxAchievement] = Field(default_factory=list)
-    raw_data: dict = Field(default_factory=dict)
+    raw_data: Any = Field(default_factory=dict, exclude=True, repr=False)
 
     @property
     def completion_percent(self) -> float:
@@ -316,6 +323,22 @@ class Game(BaseModel):
             return 0.0
         return self.progress.completion_percent
 
+    @property
+    def has_progress(self) -> bool:
+        """Whether the game has any achievements/trophies to track."""
+        return self.progress is not None and self.progress.total > 0
+
+
+def group_games_by_platform(games: Iterable[Game]) -> dict[Platform, list[Game]]:
+    """Split games into per-platform lists in a single pass.
+
+    Every platform is present in the result, with an empty list if needed.
+    """
+    groups: dict[Platform, list[Game]] = {platform: [] for platform in Platform}
+    for game in games:
+        groups[game.platform].append(game)
+    return groups
+
 
 class PriceInfo(BaseModel):
     """Price information for a game."""
@@ -371,6 +394,32 @@ class UserPreferences(BaseModel):
     notes: str = ""  # Free-form notes from conversations
 
 
+class LibraryStats(BaseModel):
+    """Aggregate counts over a game library."""
+
+    total_games: int = 0
+    steam_games: int = 0
+    psn_games: int = 0
+    xbox_games: int = 0
+    total_playtime_minutes: int = 0
+    games_with_playtime: int = 0
+    # Played means playtime OR a last_played date (Xbox only provides the latter)
+    played_games: int = 0
+    games_with_progress: int = 0
+    total_achievements: int = 0
+    unlocked_achievements: int = 0
+
+    @property
+    def unplayed_games(self) -> int:
+        return self.total_games - self.played_games
+
+    @property
+    def achievement_percent(self) -> float:
+        if self.total_achievements == 0:
+            return 0.0
+        return round(self.unlocked_achievements / self.total_achievements * 100, 1)
+
+
 class UserProfile(BaseModel):
     """Complete user profile."""
 
@@ -384,6 +433,53 @@ class UserProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    def games_by_platform(self) -> dict[Platform, list[Game]]:
+        """Group the library by platform (see group_games_by_platform)."""
+        return group_games_by_platform(self.games)
+
+    def library_stats(self) -> LibraryStats:
+        """Compute library counts in a single pass over the games.
+
+        Returns:
+            Platform, playtime and achievement totals for the library.
+        """
+        steam = psn = xbox = 0
+        playtime = with_playtime = played = with_progress = 0
+        total_ach = unlocked_ach = 0
+        for game in self.games:
+            platform = game.platform
+            if platform == Platform.STEAM:
+                steam += 1
+            elif platform == Platform.PLAYSTATION:
+                psn += 1
+            elif platform == Platform.XBOX:
+                xbox += 1
+            minutes = game.playtime_minutes
+            playtime += minutes
+            if minutes > 0:
+                with_playtime += 1
+                played += 1
+            elif game.last_played:
+                played += 1
+            progress = game.progress
+            if progress and progress.total > 0:
+                with_progress += 1
+                total_ach += progress.total
+                unlocked_ach += progress.unlocked
+
+        return LibraryStats(
+            total_games=len(self.games),
+            steam_games=steam,
+            psn_games=psn,
+            xbox_games=xbox,
+            total_playtime_minutes=playtime,
+            games_with_playtime=with_playtime,
+            played_games=played,
+            games_with_progress=with_progress,
+            total_achievements=total_ach,
+            unlocked_achievements=unlocked_ach,
+        )
+
 
 class ConversationMessage(BaseModel):
     """A message in the conversation history."""
@@ -403,12 +499,18 @@ class ConversationHistory(BaseModel):
 
     messages: list[ConversationMessage] = Field(default_factory=list)
     max_messages: int = 50  # Keep last N messages for context
-
-    def add_message(self, role: str, content: str) -> None:
-        """Add a message and trim if needed."""
-        self.messages.append(ConversationMessage(role=role, content=content))
+    # Conversation these messages belong to, so per-conversation state such as
+    # history summaries never leaks between chats. None for the CLI's single
+    # conversation; not saved with the history.
+    conversation_id: str | None = Field(default=None, exclude=True)
+
+    def add_message(self, role: str, content: str) -> ConversationMessage:
+        """Add a message and trim if needed. Returns the new message."""
+        message = ConversationMessage(role=role, content=content)
+        self.messages.append(message)
         if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
+            del self.messages[: -self.max_messages]
+        return message
 
 
 class Conversation(BaseModel):
@@ -428,10 +530,15 @@ class Conversation(BaseModel):
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message and trim if needed."""
-        self.messages.append(ConversationMessage(role=role, content=content))
+        # One clock read for both timestamps; datetime.now() is already naive,
+        # so the timestamp validator has nothing to do
+        now = datetime.now()
+        self.messages.append(
+            ConversationMessage.model_construct(role=role, content=content, timestamp=now)
+        )
         if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
-        self.updated_at = datetime.now()
+            del self.messages[: -self.max_messages]
+        self.updated_at = now
 
 
 class ConversationMetadata(BaseModel):
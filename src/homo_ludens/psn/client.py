@@ -9,12 +9,17 @@ To get your NPSSO token:
 Note: The token expires after ~60 days and needs to be refreshed.
 """
 
+import heapq
+import logging
 import os
-from datetime import datetime
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
-from psnawp_api import PSNAWP
-from psnawp_api.core.psnawp_exceptions import PSNAWPNotFoundError, PSNAWPAuthenticationError
-from psnawp_api.models.trophies.trophy_constants import TrophyType
+from pydantic import TypeAdapter
 
 from homo_ludens.models import (
     Game,
@@ -25,6 +30,27 @@ from homo_ludens.models import (
     PlayStationProgressStats,
     percent_to_rarity_tier,
 )
+from homo_ludens.storage import ResponseCache
+
+# psnawp (and its requests stack) is imported inside PSNClient so that loading
+# this module, e.g. via the web routes, stays cheap when PSN is never used
+if TYPE_CHECKING:
+    from psnawp_api import PSNAWP
+    from psnawp_api.models.trophies.trophy_constants import TrophyType
+
+logger = logging.getLogger(__name__)
+
+
+# Concurrent per-title trophy requests; kept small to stay clear of PSN rate limits
+PSN_FETCH_WORKERS = 8
+
+# Seconds the per-client trophy title index is reused before it is refetched
+PSN_TITLE_INDEX_TTL = 300
+
+# Per-title trophy lists, reused across syncs while the title shows no new
+# trophy activity; refreshed after the TTL so rarity percentages stay current
+TROPHY_CACHE_NAMESPACE = "psn_trophies"
+TROPHY_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
 
 
 class PSNAPIError(Exception):
@@ -33,45 +59,220 @@ class PSNAPIError(Exception):
     pass
 
 
-def _map_trophy_type_to_tier(trophy_type: TrophyType) -> TrophyTier:
+# Authenticated psnawp sessions keyed by NPSSO token, so repeated syncs in one
+# process skip the token exchange and reuse the pooled HTTP session. Web
+# requests and the trophy fetch workers share them across threads, so the
+# dict is only touched under _sessions_lock.
+_sessions: dict[str, "PSNAWP"] = {}
+_sessions_lock = threading.Lock()
+
+
+# psnawp TrophyType member names mapped to our tiers; keyed by name so the
+# psnawp enum does not have to be imported at module load
+_TROPHY_TYPE_TIERS = {
+    "BRONZE": TrophyTier.BRONZE,
+    "SILVER": TrophyTier.SILVER,
+    "GOLD": TrophyTier.GOLD,
+    "PLATINUM": TrophyTier.PLATINUM,
+}
+
+
+def _tune_psnawp_session(psnawp: "PSNAWP") -> None:
+    """Size psnawp's requests connection pool for the trophy fetch workers.
+
+    Also retries transient 429/5xx responses with backoff. psnawp keeps its
+    session on internal attributes, so this is skipped if they move.
+    """
+    authenticator = getattr(psnawp, "authenticator", None)
+    session = getattr(getattr(authenticator, "request_builder", None), "session", None)
+    if session is None:
+        return
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response back so psnawp can map it to its own errors
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=PSN_FETCH_WORKERS, max_retries=retry),
+    )
+
+
+def _serialize_token_refresh(psnawp: "PSNAWP") -> None:
+    """Make psnawp refresh its access token under a per-session lock.
+
+    psnawp checks the token before every request and refreshes it in place
+    without locking, so threads that hit an expired token together would each
+    post a refresh and overwrite the token response while the others read it.
+    With the lock, later threads wait and then find the token already renewed.
+    """
+    authenticator = psnawp.authenticator
+    refresh = authenticator.fetch_access_token_from_refresh
+    lock = threading.Lock()
+
+    def locked_refresh() -> None:
+        with lock:
+            refresh()
+
+    authenticator.fetch_access_token_from_refresh = locked_refresh
+
+
+def _get_session(npsso_token: str) -> "PSNAWP":
+    """Return the shared psnawp session for a token, authenticating it on first use.
+
+    A new session exchanges the NPSSO token for access tokens before it is
+    published, so every shared session only ever refreshes.
+    """
+    from psnawp_api import PSNAWP
+
+    with _sessions_lock:
+        psnawp = _sessions.get(npsso_token)
+        if psnawp is None:
+            psnawp = PSNAWP(npsso_token)
+            _tune_psnawp_session(psnawp)
+            authenticator = psnawp.authenticator
+            authenticator.fetch_access_token_from_authorization(
+                authenticator.get_authorization_code()
+            )
+            _serialize_token_refresh(psnawp)
+            _sessions[npsso_token] = psnawp
+        return psnawp
+
+
+def _drop_session(npsso_token: str, psnawp: "PSNAWP") -> None:
+    """Forget a session whose tokens were rejected, so the next client re-authenticates."""
+    with _sessions_lock:
+        if _sessions.get(npsso_token) is psnawp:
+            del _sessions[npsso_token]
+
+
+def _auth_errors() -> tuple[type[Exception], ...]:
+    """psnawp errors meaning the session's tokens are no longer accepted."""
+    from psnawp_api.core.psnawp_exceptions import (
+        PSNAWPAuthenticationError,
+        PSNAWPInvalidTokenError,
+        PSNAWPUnauthorizedError,
+    )
+
+    return (PSNAWPAuthenticationError, PSNAWPInvalidTokenError, PSNAWPUnauthorizedError)
+
+
+def _map_trophy_type_to_tier(trophy_type: "TrophyType") -> TrophyTier:
     """Convert psnawp TrophyType to our TrophyTier enum."""
-    mapping = {
-        TrophyType.BRONZE: TrophyTier.BRONZE,
-        TrophyType.SILVER: TrophyTier.SILVER,
-        TrophyType.GOLD: TrophyTier.GOLD,
-        TrophyType.PLATINUM: TrophyTier.PLATINUM,
-    }
-    return mapping.get(trophy_type, TrophyTier.BRONZE)
+    return _TROPHY_TYPE_TIERS.get(getattr(trophy_type, "name", None), TrophyTier.BRONZE)
+
+
+# PSN rarity names (psnawp TrophyRarity member names, lowercased) mapped to our tiers
+_PSN_RARITY_TIERS = {
+    "ultra_rare": RarityTier.ULTRA_RARE,
+    "very_rare": RarityTier.VERY_RARE,
+    "rare": RarityTier.RARE,
+    "uncommon": RarityTier.UNCOMMON,
+    "common": RarityTier.COMMON,
+}
 
 
 def _map_psn_rarity_to_tier(rarity_value: str | None) -> RarityTier | None:
     """Convert PSN rarity string to our RarityTier enum."""
     if rarity_value is None:
         return None
-    rarity_lower = str(rarity_value).lower()
-    if "ultra" in rarity_lower:
-        return RarityTier.ULTRA_RARE
-    elif "very" in rarity_lower:
-        return RarityTier.VERY_RARE
-    elif "rare" in rarity_lower:
-        return RarityTier.RARE
-    elif "uncommon" in rarity_lower:
-        return RarityTier.UNCOMMON
-    else:
-        return RarityTier.COMMON
+    return _PSN_RARITY_TIERS.get(str(rarity_value).lower(), RarityTier.COMMON)
+
+
+def _trophy_row(trophy, tier: TrophyTier) -> dict:
+    """Extract the PlayStationTrophy fields from a psnawp TrophyWithProgress."""
+    earn_rate = trophy.trophy_earn_rate
+    rarity = trophy.trophy_rarity
+
+    # Parse rarity percentage from string
+    rarity_percent = None
+    if earn_rate:
+        try:
+            rarity_percent = float(earn_rate)
+        except (ValueError, TypeError):
+            pass
+
+    # Get rarity tier from PSN or calculate from percentage
+    rarity_tier = None
+    if rarity:
+        rarity_tier = _map_psn_rarity_to_tier(str(rarity.name))
+    if rarity_tier is None and rarity_percent is not None:
+        rarity_tier = percent_to_rarity_tier(rarity_percent)
+
+    return {
+        "trophy_id": trophy.trophy_id,
+        "name": trophy.trophy_name,
+        "description": trophy.trophy_detail,
+        "icon_url": trophy.trophy_icon_url,
+        "tier": tier,
+        "achieved": trophy.earned or False,
+        "unlock_time": trophy.earned_date_time,
+        "rarity_percent": rarity_percent,
+        "rarity_tier": rarity_tier,
+    }
+
+
+def _trophy_row_without_progress(trophy, tier: TrophyTier) -> dict:
+    """Extract the PlayStationTrophy fields from a psnawp Trophy with no user progress."""
+    return {
+        "trophy_id": trophy.trophy_id,
+        "name": trophy.trophy_name,
+        "description": trophy.trophy_detail,
+        "icon_url": trophy.trophy_icon_url,
+        "tier": tier,
+    }
+
+
+def _trophy_row_builder(trophy_list: list) -> Callable[[Any, TrophyTier], dict]:
+    """Pick the row extractor for a trophy list.
+
+    psnawp returns one trophy class per list, so the shape is checked once on
+    the first trophy and every row then uses plain attribute access.
+    """
+    if trophy_list and not hasattr(trophy_list[0], "earned"):
+        return _trophy_row_without_progress
+    return _trophy_row
+
+
+# Reads the per-tier counts off a psnawp TrophySet in one call
+_tier_counts = attrgetter("bronze", "silver", "gold", "platinum")
+
+
+def _trophy_title_version(trophy_title) -> list:
+    """Fingerprint a trophy title's progress; it changes whenever a trophy is earned."""
+    last_updated = trophy_title.last_updated_datetime
+    earned = _tier_counts(trophy_title.earned_trophies) if trophy_title.earned_trophies else ()
+    return [last_updated.isoformat() if last_updated else None, list(earned)]
+
+# Validates a whole trophy list in one pydantic-core call instead of one
+# model constructor call per trophy
+_TROPHY_LIST_ADAPTER = TypeAdapter(list[PlayStationTrophy])
 
 
 class PSNClient:
     """Client for PlayStation Network API."""
 
-    def __init__(self, npsso_token: str | None = None):
+    def __init__(self, npsso_token: str | None = None, cache: ResponseCache | None = None):
         """Initialize PSN client.
 
         Args:
             npsso_token: NPSSO authentication token. If not provided,
                          reads from PSN_NPSSO_TOKEN environment variable.
+            cache: Optional persistent cache for per-title trophy lists.
         """
         self.npsso_token = npsso_token or os.getenv("PSN_NPSSO_TOKEN")
+        self._cache = cache
+        # Trophy titles keyed by np_communication_id, fetched on first lookup
+        self._trophy_title_index: dict[str, Any] | None = None
+        self._trophy_title_index_at = 0.0
+        # Result of the last get_owned_games() call, reused by get_recently_played
+        self._owned_games: list[Game] | None = None
 
         if not self.npsso_token:
             raise PSNAPIError(
@@ -83,29 +284,125 @@ class PSNClient:
                 "3. Copy the 'npsso' value"
             )
 
+        self._psnawp = None
         try:
-            self._psnawp = PSNAWP(self.npsso_token)
+            self._psnawp = _get_session(self.npsso_token)
             self._client = self._psnawp.me()
             self.online_id = self._client.online_id
             self.account_id = self._client.account_id
-        except PSNAWPAuthenticationError as e:
+        except _auth_errors() as e:
+            if self._psnawp is not None:
+                _drop_session(self.npsso_token, self._psnawp)
             raise PSNAPIError(
                 f"PSN authentication failed. Your token may have expired.\n"
                 f"Please get a new token from https://ca.account.sony.com/api/v1/ssocookie\n"
                 f"Error: {e}"
             )
 
-    def get_owned_games(self) -> list[Game]:
+    def _get_trophy_title_index(self, ttl: float = PSN_TITLE_INDEX_TTL) -> dict[str, Any]:
+        """Get the user's trophy titles keyed by np_communication_id.
+
+        The paginated trophy_titles() call is made at most once per `ttl`
+        seconds; lookups in between are dict hits.
+        """
+        if (
+            self._trophy_title_index is None
+            or time.monotonic() - self._trophy_title_index_at > ttl
+        ):
+            self._set_trophy_title_index(self._client.trophy_titles())
+        return self._trophy_title_index
+
+    def _set_trophy_title_index(self, trophy_titles) -> None:
+        """Index freshly fetched trophy titles by np_communication_id."""
+        self._trophy_title_index = {tt.np_communication_id: tt for tt in trophy_titles}
+        self._trophy_title_index_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop cached trophy titles and games so the next call refetches them."""
+        self._trophy_title_index = None
+        self._owned_games = None
+
+    def _fetch_title_trophies(self, trophy_title) -> list[PlayStationTrophy]:
+        """Fetch individual trophies with progress for one trophy title.
+
+        Returns an empty list if the title has no trophies or PSN fails to
+        return them, so the game keeps its counts only.
+        """
+        from psnawp_api.core.psnawp_exceptions import PSNAWPError
+        from requests import RequestException
+
+        if not trophy_title.defined_trophies:
+            return []
+
+        # Get platform for trophy fetch
+        platform = next(iter(trophy_title.title_platform or ()), None)
+        if not platform:
+            return []
+
+        cache_key = trophy_title.np_communication_id
+        version = _trophy_title_version(trophy_title)
+        if self._cache is not None:
+            entry = self._cache.get(TROPHY_CACHE_NAMESPACE, cache_key)
+            if entry and entry.age < TROPHY_CACHE_TTL and entry.payload.get("version") == version:
+                return _TROPHY_LIST_ADAPTER.validate_python(entry.payload["trophies"])
+
+        try:
+            trophy_list = list(self._client.trophies(
+                np_communication_id=trophy_title.np_communication_id,
+                platform=platform,
+                include_progress=True,
+            ))
+        except (PSNAWPError, RequestException) as e:
+            # Continue with the title's trophy counts only
+            logger.warning("Could not fetch PSN trophies for %s: %s", cache_key, e)
+            return []
+
+        trophy_row = _trophy_row_builder(trophy_list)
+        trophies = _TROPHY_LIST_ADAPTER.validate_python([
+            trophy_row(trophy, _map_trophy_type_to_tier(trophy.trophy_type))
+            for trophy in trophy_list
+        ])
+
+        if self._cache is not None and trophies:
+            self._cache.put(
+                TROPHY_CACHE_NAMESPACE,
+                cache_key,
+                {
+                    "version": version,
+                    "trophies": _TROPHY_LIST_ADAPTER.dump_python(trophies, mode="json"),
+                },
+            )
+        return trophies
+
+    def get_owned_games(self, include_trophy_details: bool = True) -> list[Game]:
         """Fetch all games from user's trophy list (indicates ownership/played).
 
+        Args:
+            include_trophy_details: Fetch each game's individual trophies (one
+                request per title). When False, games only carry the per-tier
+                trophy counts from the title list.
+
         Returns:
             List of Game objects with trophy information.
         """
+        from psnawp_api.core.psnawp_exceptions import PSNAWPNotFoundError
+
         games = []
 
         try:
             # Get all trophy titles (games the user has played)
-            for trophy_title in self._client.trophy_titles():
+            trophy_titles = list(self._client.trophy_titles())
+            self._set_trophy_title_index(trophy_titles)
+
+            if include_trophy_details:
+                # Per-title trophy lists are one blocking request each, so fetch
+                # them on a small thread pool; map() keeps the title order
+                with ThreadPoolExecutor(max_workers=PSN_FETCH_WORKERS) as pool:
+                    title_trophies = list(pool.map(self._fetch_title_trophies, trophy_titles))
+            else:
+                title_trophies = [[] for _ in trophy_titles]
+
+            for trophy_title, trophies in zip(trophy_titles, title_trophies):
                 game = Game(
                     id=f"psn_{trophy_title.np_communication_id}",
                     name=trophy_title.title_name or f"Unknown ({trophy_title.np_communication_id})",
@@ -117,25 +414,18 @@ class PSNClient:
 
                 # Build trophy stats
                 if trophy_title.defined_trophies:
-                    bronze_total = trophy_title.defined_trophies.bronze
-                    silver_total = trophy_title.defined_trophies.silver
-                    gold_total = trophy_title.defined_trophies.gold
-                    platinum_total = trophy_title.defined_trophies.platinum
+                    bronze_total, silver_total, gold_total, platinum_total = _tier_counts(
+                        trophy_title.defined_trophies
+                    )
                     total = bronze_total + silver_total + gold_total + platinum_total
 
-                    bronze_unlocked = 0
-                    silver_unlocked = 0
-                    gold_unlocked = 0
-                    platinum_unlocked = 0
+                    bronze_unlocked = silver_unlocked = gold_unlocked = platinum_unlocked = 0
                     if trophy_title.earned_trophies:
-                        bronze_unlocked = trophy_title.earned_trophies.bronze
-                        silver_unlocked = trophy_title.earned_trophies.silver
-                        gold_unlocked = trophy_title.earned_trophies.gold
-                        platinum_unlocked = trophy_title.earned_trophies.platinum
+                        bronze_unlocked, silver_unlocked, gold_unlocked, platinum_unlocked = (
+                            _tier_counts(trophy_title.earned_trophies)
+                        )
                     unlocked = bronze_unlocked + silver_unlocked + gold_unlocked + platinum_unlocked
 
-                    # Fetch individual trophies with progress
-                    trophies = []
                     raw_data = {
                         "defined_trophies": {
                             "bronze": bronze_total,
@@ -152,51 +442,6 @@ class PSNClient:
                         "progress": trophy_title.progress,
                     }
 
-                    try:
-                        # Get platform for trophy fetch
-                        platform = None
-                        if trophy_title.title_platform:
-                            platform = list(trophy_title.title_platform)[0]
-                        
-                        if platform:
-                            trophy_list = list(self._client.trophies(
-                                np_communication_id=trophy_title.np_communication_id,
-                                platform=platform,
-                                include_progress=True,
-                            ))
-                            
-                            for trophy in trophy_list:
-                                # Parse rarity percentage from string
-                                rarity_percent = None
-                                if hasattr(trophy, 'trophy_earn_rate') and trophy.trophy_earn_rate:
-                                    try:
-                                        rarity_percent = float(trophy.trophy_earn_rate)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                # Get rarity tier from PSN or calculate from percentage
-                                rarity_tier = None
-                                if hasattr(trophy, 'trophy_rarity') and trophy.trophy_rarity:
-                                    rarity_tier = _map_psn_rarity_to_tier(str(trophy.trophy_rarity.name))
-                                if rarity_tier is None and rarity_percent is not None:
-                                    rarity_tier = percent_to_rarity_tier(rarity_percent)
-
-                                ps_trophy = PlayStationTrophy(
-                                    trophy_id=trophy.trophy_id,
-                                    name=trophy.trophy_name,
-                                    description=trophy.trophy_detail,
-                                    icon_url=getattr(trophy, 'trophy_icon_url', None),
-                                    tier=_map_trophy_type_to_tier(trophy.trophy_type),
-                                    achieved=getattr(trophy, 'earned', False) or False,
-                                    unlock_time=getattr(trophy, 'earned_date_time', None),
-                                    rarity_percent=rarity_percent,
-                                    rarity_tier=rarity_tier,
-                                )
-                                trophies.append(ps_trophy)
-                    except Exception:
-                        # Failed to fetch individual trophies, continue with counts only
-                        pass
-
                     game.progress = PlayStationProgressStats(
                         total=total,
                         unlocked=unlocked,
@@ -217,9 +462,13 @@ class PSNClient:
         except PSNAWPNotFoundError:
             # User has no trophy titles
             pass
+        except _auth_errors() as e:
+            _drop_session(self.npsso_token, self._psnawp)
+            raise PSNAPIError(f"PSN authentication failed, your token may have expired: {e}")
         except Exception as e:
             raise PSNAPIError(f"Failed to fetch PSN games: {e}")
 
+        self._owned_games = games
         return games
 
     def get_game_trophies(self, np_communication_id: str) -> PlayStationProgressStats | None:
@@ -232,27 +481,17 @@ class PSNClient:
             PlayStationProgressStats with individual trophies, or None if not found.
         """
         try:
-            # Get the trophy title
-            trophy_titles = list(self._client.trophy_titles())
-            trophy_title = None
-            for tt in trophy_titles:
-                if tt.np_communication_id == np_communication_id:
-                    trophy_title = tt
-                    break
-
+            trophy_title = self._get_trophy_title_index().get(np_communication_id)
             if not trophy_title:
                 return None
 
             # Get platform
-            platform = None
-            if trophy_title.title_platform:
-                platform = list(trophy_title.title_platform)[0]
-            
+            platform = next(iter(trophy_title.title_platform or ()), None)
             if not platform:
                 return None
 
             # Get individual trophies with progress
-            trophies = []
+            rows = []
             trophy_list = list(self._client.trophies(
                 np_communication_id=np_communication_id,
                 platform=platform,
@@ -260,62 +499,34 @@ class PSNClient:
             ))
 
             # Count by tier
-            tier_counts = {
-                TrophyTier.BRONZE: {"total": 0, "unlocked": 0},
-                TrophyTier.SILVER: {"total": 0, "unlocked": 0},
-                TrophyTier.GOLD: {"total": 0, "unlocked": 0},
-                TrophyTier.PLATINUM: {"total": 0, "unlocked": 0},
-            }
+            tier_totals = dict.fromkeys(TrophyTier, 0)
+            tier_unlocked = dict.fromkeys(TrophyTier, 0)
 
+            trophy_row = _trophy_row_builder(trophy_list)
+            unlocked = 0
             for trophy in trophy_list:
                 tier = _map_trophy_type_to_tier(trophy.trophy_type)
-                tier_counts[tier]["total"] += 1
+                tier_totals[tier] += 1
                 
-                achieved = getattr(trophy, 'earned', False) or False
-                if achieved:
-                    tier_counts[tier]["unlocked"] += 1
-
-                # Parse rarity
-                rarity_percent = None
-                if hasattr(trophy, 'trophy_earn_rate') and trophy.trophy_earn_rate:
-                    try:
-                        rarity_percent = float(trophy.trophy_earn_rate)
-                    except (ValueError, TypeError):
-                        pass
-
-                rarity_tier = None
-                if hasattr(trophy, 'trophy_rarity') and trophy.trophy_rarity:
-                    rarity_tier = _map_psn_rarity_to_tier(str(trophy.trophy_rarity.name))
-                if rarity_tier is None and rarity_percent is not None:
-                    rarity_tier = percent_to_rarity_tier(rarity_percent)
-
-                ps_trophy = PlayStationTrophy(
-                    trophy_id=trophy.trophy_id,
-                    name=trophy.trophy_name,
-                    description=trophy.trophy_detail,
-                    icon_url=getattr(trophy, 'trophy_icon_url', None),
-                    tier=tier,
-                    achieved=achieved,
-                    unlock_time=getattr(trophy, 'earned_date_time', None),
-                    rarity_percent=rarity_percent,
-                    rarity_tier=rarity_tier,
-                )
-                trophies.append(ps_trophy)
+                row = trophy_row(trophy, tier)
+                if row.get("achieved"):
+                    tier_unlocked[tier] += 1
+                    unlocked += 1
+                rows.append(row)
 
-            total = len(trophies)
-            unlocked = len([t for t in trophies if t.achieved])
+            trophies = _TROPHY_LIST_ADAPTER.validate_python(rows)
 
             return PlayStationProgressStats(
-                total=total,
+                total=len(rows),
                 unlocked=unlocked,
-                bronze_total=tier_counts[TrophyTier.BRONZE]["total"],
-                bronze_unlocked=tier_counts[TrophyTier.BRONZE]["unlocked"],
-                silver_total=tier_counts[TrophyTier.SILVER]["total"],
-                silver_unlocked=tier_counts[TrophyTier.SILVER]["unlocked"],
-                gold_total=tier_counts[TrophyTier.GOLD]["total"],
-                gold_unlocked=tier_counts[TrophyTier.GOLD]["unlocked"],
-                platinum_total=tier_counts[TrophyTier.PLATINUM]["total"],
-                platinum_unlocked=tier_counts[TrophyTier.PLATINUM]["unlocked"],
+                bronze_total=tier_totals[TrophyTier.BRONZE],
+                bronze_unlocked=tier_unlocked[TrophyTier.BRONZE],
+                silver_total=tier_totals[TrophyTier.SILVER],
+                silver_unlocked=tier_unlocked[TrophyTier.SILVER],
+                gold_total=tier_totals[TrophyTier.GOLD],
+                gold_unlocked=tier_unlocked[TrophyTier.GOLD],
+                platinum_total=tier_totals[TrophyTier.PLATINUM],
+                platinum_unlocked=tier_unlocked[TrophyTier.PLATINUM],
                 trophies=trophies,
             )
 
@@ -331,13 +542,14 @@ class PSNClient:
         Returns:
             List of recently played games sorted by last trophy date.
         """
-        games = self.get_owned_games()
+        games = self._owned_games
+        if games is None:
+            # Ranking only needs last_played, not the per-title trophy lists
+            games = self.get_owned_games(include_trophy_details=False)
 
-        # Sort by last_played (most recent first)
+        # Most recent first; a partial sort since only `limit` games are kept
         games_with_activity = [g for g in games if g.last_played]
-        games_with_activity.sort(key=lambda g: g.last_played or datetime.min, reverse=True)
-
-        return games_with_activity[:limit]
+        return heapq.nlargest(limit, games_with_activity, key=attrgetter("last_played"))
 
     def close(self):
         """Close the client (no-op for psnawp, but matches SteamClient interface)."""
@@ -1,9 +1,15 @@
 """LLM-based game recommender using OpenAI/Azure OpenAI."""
 
+import hashlib
+import heapq
 import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from functools import cache
+from operator import attrgetter
+from typing import NamedTuple
 
-from openai import AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 
 from homo_ludens.models import ConversationHistory, ConversationMessage, Game, Platform, UserProfile
 
@@ -39,24 +45,122 @@ Keep responses concise but helpful. You're a gaming buddy, not a formal assistan
 """
 
 
+# Chat history handling: older turns are folded into a running summary once
+# more than HISTORY_SUMMARY_TRIGGER messages would be sent verbatim, keeping
+# the latest HISTORY_RECENT_MESSAGES as-is
+HISTORY_RECENT_MESSAGES = 6
+HISTORY_SUMMARY_TRIGGER = 10
+
+# Summaries keyed by conversation and the last message they cover. Module-level
+# so they survive across Recommender instances (the web app creates one per
+# request).
+_history_summaries: dict[tuple[str | None, datetime, str], str] = {}
+_HISTORY_SUMMARY_CACHE_SIZE = 64
+
+HISTORY_SUMMARY_PROMPT = """Summarize this conversation between a user and their gaming companion in at most 150 tokens.
+Keep the user's stated preferences, mood, constraints, and any games that were recommended, accepted, or rejected.
+Return ONLY the summary.
+
+{previous}Conversation:
+{conversation}"""
+
+
+# Rough cap on input tokens per chat request. Oldest history is dropped first
+# when a turn would exceed it (e.g. after very long pasted messages).
+PROMPT_TOKEN_BUDGET = 6000
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheaply estimate the token count of a message.
+
+    English averages about 4 characters per token, while CJK text is closer
+    to one token per character, so the two are counted separately. The
+    constant covers per-message overhead.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 4
+
+
+def _summary_key(
+    history: ConversationHistory, message: ConversationMessage
+) -> tuple[str | None, datetime, str]:
+    """Identify a message across reloads of the same conversation.
+
+    Timestamps only identify a message within one conversation, so the
+    conversation id is part of the key.
+    """
+    return (history.conversation_id, message.timestamp, message.role)
+
+
+def _summary_prompt(previous: str | None, messages: list[ConversationMessage]) -> str:
+    """Build the request that folds messages into the running summary."""
+    conversation_text = "\n".join(f"{msg.role}: {msg.content}" for msg in messages)
+    return HISTORY_SUMMARY_PROMPT.format(
+        previous=f"Summary so far:\n{previous}\n\n" if previous else "",
+        conversation=conversation_text,
+    )
+
+
+class LLMConfig(NamedTuple):
+    """LLM credentials resolved from the environment."""
+
+    azure_endpoint: str | None
+    azure_api_key: str | None
+    azure_deployment: str
+    openai_api_key: str | None
+
+
+@cache
+def _load_llm_config() -> LLMConfig:
+    """Read the LLM settings from the environment once per process."""
+    return LLMConfig(
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        azure_api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini"),
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+    )
+
+
+# API clients shared by every Recommender so that per-request instances (as in
+# the web app) reuse one connection pool. Keyed by a digest of the client
+# settings so API keys are not kept as dict keys, and bounded since callers
+# may pass their own credentials to each Recommender.
+_clients: dict[str, OpenAI | AsyncOpenAI] = {}
+_CLIENT_CACHE_SIZE = 4
+
+
+def _shared_client(client_cls: type, options: dict[str, str]) -> OpenAI | AsyncOpenAI:
+    """Return the shared client of client_cls for these options, creating it on first use."""
+    settings = repr((client_cls.__name__, sorted(options.items())))
+    key = hashlib.sha256(settings.encode()).hexdigest()
+    client = _clients.get(key)
+    if client is None:
+        if len(_clients) >= _CLIENT_CACHE_SIZE:
+            # Recommenders still holding an evicted client keep using it
+            del _clients[next(iter(_clients))]
+        client = _clients[key] = client_cls(**options)
+    return client
+
+
+# Platform indicators used in the prompt; anything else is shown as PC
+PLATFORM_ICONS = {
+    Platform.PLAYSTATION: "🎮",
+    Platform.XBOX: "🟢",  # Xbox green
+}
+DEFAULT_PLATFORM_ICON = "🖥️"  # Steam/PC
+
+
 def _format_game_with_achievements(game: Game) -> str:
     """Format a game entry with playtime and achievement/trophy/gamerscore info."""
-    hours = game.playtime_minutes // 60
-    mins = game.playtime_minutes % 60
-    
-    # Platform indicator (Xbox uses same icon as PlayStation since it's a console)
-    if game.platform == Platform.PLAYSTATION:
-        platform_icon = "🎮"
-    elif game.platform == Platform.XBOX:
-        platform_icon = "🟢"  # Xbox green
-    else:
-        platform_icon = "🖥️"  # Steam/PC
-    base = f"  - {platform_icon} {game.name}: {hours}h {mins}m"
-    
-    if game.progress and game.progress.total > 0:
-        base += f" ({game.progress.display_summary})"
-    
-    return base
+    hours, mins = divmod(game.playtime_minutes, 60)
+    platform_icon = PLATFORM_ICONS.get(game.platform, DEFAULT_PLATFORM_ICON)
+
+    # Most games have no progress data, so build their line in one go
+    progress = game.progress
+    if progress is None or progress.total == 0:
+        return f"  - {platform_icon} {game.name}: {hours}h {mins}m"
+
+    return f"  - {platform_icon} {game.name}: {hours}h {mins}m ({progress.display_summary})"
 
 
 def build_context_prompt(profile: UserProfile) -> str:
@@ -64,50 +168,58 @@ def build_context_prompt(profile: UserProfile) -> str:
     if not profile.games:
         return "The user hasn't synced their game library yet."
 
-    # Sort by playtime
-    sorted_games = sorted(profile.games, key=lambda g: g.playtime_minutes, reverse=True)
+    # Bucket the library in one pass; the top-K picks below then use
+    # heapq.nlargest, which matches sorted(reverse=True)[:k] without sorting
+    # everything. Ties fall back to playtime, as they did when every list was
+    # cut from the playtime-sorted library.
+    platform_counts = dict.fromkeys(Platform, 0)
+    recent_candidates = []
+    completed_candidates = []
+    unplayed = []
+    for g in profile.games:
+        platform_counts[g.platform] += 1
+        if g.last_played is not None:
+            recent_candidates.append(g)
+        if g.playtime_minutes == 0 and len(unplayed) < 10:
+            unplayed.append(g)
+        if g.has_progress and g.progress.completion_percent >= 50:
+            completed_candidates.append(g)
 
     # Top played games with achievement info
-    top_played = sorted_games[:10]
-    top_played_str = "\n".join(_format_game_with_achievements(g) for g in top_played)
+    top_played = heapq.nlargest(10, profile.games, key=attrgetter("playtime_minutes"))
+    top_played_str = "\n".join([_format_game_with_achievements(g) for g in top_played])
 
     # Recently played (if we have last_played data)
-    recent = [g for g in sorted_games if g.last_played is not None]
-    recent = sorted(recent, key=lambda g: _to_naive_datetime(g.last_played), reverse=True)[:5]
+    recent = heapq.nlargest(
+        5,
+        recent_candidates,
+        key=lambda g: (_to_naive_datetime(g.last_played), g.playtime_minutes),
+    )
     recent_str = (
-        "\n".join(_format_game_with_achievements(g) for g in recent)
+        "\n".join([_format_game_with_achievements(g) for g in recent])
         if recent
         else "  No recent play data available"
     )
 
     # High achievement completion games (loved games)
-    games_with_achievements = [
-        g for g in sorted_games 
-        if g.progress and g.progress.total > 0
-    ]
-    completed_games = [
-        g for g in games_with_achievements 
-        if g.progress and g.progress.completion_percent >= 50
-    ]
-    completed_games = sorted(
-        completed_games, 
-        key=lambda g: g.progress.completion_percent if g.progress else 0, 
-        reverse=True
-    )[:5]
+    completed_games = heapq.nlargest(
+        5,
+        completed_candidates,
+        key=lambda g: (g.progress.completion_percent, g.playtime_minutes),
+    )
     completed_str = (
-        "\n".join(
+        "\n".join([
             f"  - {g.name}: {g.progress.display_summary}"
             for g in completed_games
             if g.progress
-        )
+        ])
         if completed_games
         else "  No achievement data available"
     )
 
     # Unplayed games
-    unplayed = [g for g in sorted_games if g.playtime_minutes == 0][:10]
     unplayed_str = (
-        "\n".join(f"  - {g.name}" for g in unplayed)
+        "\n".join([f"  - {g.name}" for g in unplayed])
         if unplayed
         else "  All games have been played!"
     )
@@ -123,14 +235,13 @@ def build_context_prompt(profile: UserProfile) -> str:
         prefs_str += f"Notes: {prefs.notes}\n"
 
     # Platform breakdown
-    steam_games = [g for g in profile.games if g.platform == Platform.STEAM]
-    psn_games = [g for g in profile.games if g.platform == Platform.PLAYSTATION]
-    xbox_games = [g for g in profile.games if g.platform == Platform.XBOX]
-    platform_str = f"Platforms: Steam ({len(steam_games)} games)"
-    if psn_games:
-        platform_str += f", PlayStation ({len(psn_games)} games)"
-    if xbox_games:
-        platform_str += f", Xbox ({len(xbox_games)} games)"
+    psn_count = platform_counts[Platform.PLAYSTATION]
+    xbox_count = platform_counts[Platform.XBOX]
+    platform_str = f"Platforms: Steam ({platform_counts[Platform.STEAM]} games)"
+    if psn_count:
+        platform_str += f", PlayStation ({psn_count} games)"
+    if xbox_count:
+        platform_str += f", Xbox ({xbox_count} games)"
 
     return f"""USER'S GAME LIBRARY ({len(profile.games)} games total):
 {platform_str}
@@ -201,33 +312,44 @@ class Recommender:
                          and optionally AZURE_OPENAI_DEPLOYMENT env vars.
         """
         self.model = model
+        # (profile version, prompt) for the last library context built
+        self._context_cache: tuple[tuple, str] | None = None
+
+        config = _load_llm_config()
 
         # Check for Azure OpenAI first
-        azure_endpoint = azure_endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
-        azure_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
-        azure_deployment = azure_deployment or os.getenv(
-            "AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini"
-        )
+        azure_endpoint = azure_endpoint or config.azure_endpoint
+        azure_key = api_key or config.azure_api_key
+        azure_deployment = azure_deployment or config.azure_deployment
 
         if azure_endpoint and azure_key:
-            self.client = AzureOpenAI(
-                api_key=azure_key,
-                api_version="2024-02-15-preview",
-                azure_endpoint=azure_endpoint,
-            )
+            self._client_options = {
+                "api_key": azure_key,
+                "api_version": "2024-02-15-preview",
+                "azure_endpoint": azure_endpoint,
+            }
             self.model = azure_deployment
             self._is_azure = True
         else:
             # Fall back to OpenAI
-            openai_key = api_key or os.getenv("OPENAI_API_KEY")
+            openai_key = api_key or config.openai_api_key
             if not openai_key:
                 raise ValueError(
                     "No API key found. Set OPENAI_API_KEY or AZURE_OPENAI_API_KEY "
                     "environment variable."
                 )
-            self.client = OpenAI(api_key=openai_key)
+            self._client_options = {"api_key": openai_key}
             self._is_azure = False
 
+        client_cls = AzureOpenAI if self._is_azure else OpenAI
+        self.client = _shared_client(client_cls, self._client_options)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async API client with the same credentials, created on first use."""
+        client_cls = AsyncAzureOpenAI if self._is_azure else AsyncOpenAI
+        return _shared_client(client_cls, self._client_options)
+
     def chat(
         self,
         user_message: str,
@@ -244,27 +366,217 @@ class Recommender:
         Returns:
             The assistant's response.
         """
-        # Build messages
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(user_message, profile, history),  # type: ignore
+            max_completion_tokens=500,
+        )
+
+        return response.choices[0].message.content or ""
+
+    async def achat(
+        self,
+        user_message: str,
+        profile: UserProfile,
+        history: ConversationHistory,
+    ) -> str:
+        """Async version of chat() that does not block the event loop.
+
+        Args:
+            user_message: The user's message.
+            profile: User's profile with game library.
+            history: Conversation history for context.
+
+        Returns:
+            The assistant's response.
+        """
+        history_messages = await self._ahistory_messages(history)
+        messages = self._assemble_messages(user_message, profile, history_messages)
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,  # type: ignore
+            max_completion_tokens=500,
+        )
+
+        return response.choices[0].message.content or ""
+
+    def chat_stream(
+        self,
+        user_message: str,
+        profile: UserProfile,
+        history: ConversationHistory,
+    ) -> Iterator[str]:
+        """Send a message and stream the response as it is generated.
+
+        Args:
+            user_message: The user's message.
+            profile: User's profile with game library.
+            history: Conversation history for context.
+
+        Yields:
+            Chunks of the assistant's response text.
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(user_message, profile, history),  # type: ignore
+            max_completion_tokens=500,
+            stream=True,
+        )
+
+        # Closing the generator early (e.g. the user interrupts) closes the HTTP stream
+        with stream:
+            for chunk in stream:
+                # Azure sends an initial chunk with no choices (content filter results)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    def _build_messages(
+        self,
+        user_message: str,
+        profile: UserProfile,
+        history: ConversationHistory,
+    ) -> list[dict[str, str]]:
+        """Build the API message list for a chat turn."""
+        return self._assemble_messages(user_message, profile, self._history_messages(history))
+
+    def _assemble_messages(
+        self,
+        user_message: str,
+        profile: UserProfile,
+        history_messages: list[dict[str, str]],
+    ) -> list[dict[str, str]]:
+        """Combine prompts, history and the current message within the token budget."""
         messages = [
             {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "system", "content": build_context_prompt(profile)},
+            {"role": "system", "content": self._context_prompt(profile)},
         ]
+        current = {"role": "user", "content": user_message}
 
-        # Add conversation history
-        for msg in history.messages[-20:]:  # Last 20 messages for context
-            messages.append({"role": msg.role, "content": msg.content})
+        # Add conversation history, newest first, until the token budget is used up
+        budget = PROMPT_TOKEN_BUDGET - sum(
+            _estimate_tokens(m["content"]) for m in (*messages, current)
+        )
+        keep_from = len(history_messages)
+        while keep_from > 0:
+            budget -= _estimate_tokens(history_messages[keep_from - 1]["content"])
+            if budget < 0:
+                break
+            keep_from -= 1
+        messages.extend(history_messages[keep_from:])
 
         # Add current message
-        messages.append({"role": "user", "content": user_message})
+        messages.append(current)
+        return messages
+
+    def _history_messages(self, history: ConversationHistory) -> list[dict[str, str]]:
+        """Build the history part of the message list.
+
+        Turns older than the recent window are replaced by a cached summary
+        that is extended, with one extra API call, each time
+        HISTORY_SUMMARY_TRIGGER unsummarized messages have piled up.
+        """
+        start, summary, cut = self._summary_state(history)
+        if cut is not None:
+            try:
+                summary = self._summarize_history(summary, history.messages[start:cut])
+            except Exception:
+                summary = None
+        return self._history_with_summary(history, start, summary, cut)
+
+    async def _ahistory_messages(self, history: ConversationHistory) -> list[dict[str, str]]:
+        """Async variant of _history_messages, summarizing with the async client."""
+        start, summary, cut = self._summary_state(history)
+        if cut is not None:
+            try:
+                summary = await self._asummarize_history(summary, history.messages[start:cut])
+            except Exception:
+                summary = None
+        return self._history_with_summary(history, start, summary, cut)
+
+    def _summary_state(self, history: ConversationHistory) -> tuple[int, str | None, int | None]:
+        """Find the cached summary for a history and whether it needs extending.
+
+        Returns:
+            (start, summary, cut): messages before start are covered by
+            summary; cut is set when history[start:cut] should be folded in.
+        """
+        messages = history.messages
+        # Find the newest message an existing summary covers
+        start = 0
+        summary = None
+        for i in range(len(messages) - 1, -1, -1):
+            summary = _history_summaries.get(_summary_key(history, messages[i]))
+            if summary is not None:
+                start = i + 1
+                break
+
+        cut = None
+        if len(messages) - start > HISTORY_SUMMARY_TRIGGER:
+            cut = len(messages) - HISTORY_RECENT_MESSAGES
+        return start, summary, cut
+
+    def _history_with_summary(
+        self, history: ConversationHistory, start: int, summary: str | None, cut: int | None
+    ) -> list[dict[str, str]]:
+        """Turn a summary and the messages after it into API messages.
+
+        With cut set, summary is the freshly extended one covering history up
+        to cut; it is cached for later turns.
+        """
+        messages = history.messages
+        if cut is not None:
+            if not summary:
+                # Summarizing is an optimization; fall back to the last 20 messages
+                return [{"role": msg.role, "content": msg.content} for msg in messages[-20:]]
+            if len(_history_summaries) >= _HISTORY_SUMMARY_CACHE_SIZE:
+                del _history_summaries[next(iter(_history_summaries))]
+            _history_summaries[_summary_key(history, messages[cut - 1])] = summary
+            start = cut
+
+        result = []
+        if summary:
+            result.append(
+                {"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"}
+            )
+        result.extend({"role": msg.role, "content": msg.content} for msg in messages[start:])
+        return result
 
-        # Call the API
+    def _summarize_history(
+        self, previous: str | None, messages: list[ConversationMessage]
+    ) -> str:
+        """Fold conversation messages into a running summary."""
+        prompt = _summary_prompt(previous, messages)
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,  # type: ignore
-            max_completion_tokens=500,
+            messages=[{"role": "user", "content": prompt}],  # type: ignore
+            max_completion_tokens=200,
         )
 
-        return response.choices[0].message.content or ""
+        return (response.choices[0].message.content or "").strip()
+
+    async def _asummarize_history(
+        self, previous: str | None, messages: list[ConversationMessage]
+    ) -> str:
+        """Async version of _summarize_history."""
+        prompt = _summary_prompt(previous, messages)
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],  # type: ignore
+            max_completion_tokens=200,
+        )
+
+        return (response.choices[0].message.content or "").strip()
+
+    def _context_prompt(self, profile: UserProfile) -> str:
+        """Get the library context prompt, rebuilding it only when the profile changes.
+
+        Storage.save_profile bumps updated_at on every save, so together with
+        the library sizes it identifies a profile version across chat turns.
+        """
+        key = (profile.updated_at, len(profile.games), len(profile.wishlist))
+        if self._context_cache is None or self._context_cache[0] != key:
+            self._context_cache = (key, build_context_prompt(profile))
+        return self._context_cache[1]
 
     def generate_title(self, messages: list[ConversationMessage]) -> str:
         """Generate a short title for a conversation based on its messages.
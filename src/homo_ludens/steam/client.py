@@ -16,8 +16,16 @@ Set these as environment variables:
     export STEAM_ID="your_steam_id_64"
 """
 
+import asyncio
 import os
-from datetime import datetime
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, TypeVar
 
 import httpx
 
@@ -28,8 +36,8 @@ from homo_ludens.models import (
     WishlistItem,
     SteamAchievement,
     SteamProgressStats,
-    percent_to_rarity_tier,
 )
+from homo_ludens.storage import CacheEntry, ResponseCache
 
 STEAM_API_BASE = "https://api.steampowered.com"
 STEAM_STORE_API = "https://store.steampowered.com/api"
@@ -37,6 +45,49 @@ STEAM_STORE_API = "https://store.steampowered.com/api"
 # Supported languages for localization
 SUPPORTED_LANGUAGES = ["english", "schinese"]  # English and Simplified Chinese
 
+# Maximum number of items enriched at once by enrich_concurrently
+ENRICH_CONCURRENCY = 16
+
+# Apps per request when batching appdetails price lookups
+PRICE_BATCH_SIZE = 50
+
+# Achievement schemas (names, descriptions, icons) rarely change
+SCHEMA_CACHE_NAMESPACE = "steam_achievement_schema"
+SCHEMA_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# Store details change at most daily, but the prices they carry move faster
+DETAILS_CACHE_NAMESPACE = "steam_app_details"
+DETAILS_CACHE_TTL = 24 * 60 * 60  # 1 day
+PRICED_DETAILS_CACHE_TTL = 60 * 60  # 1 hour
+
+GLOBAL_STATS_CACHE_NAMESPACE = "steam_global_achievement_stats"
+GLOBAL_STATS_CACHE_TTL = 60 * 60  # 1 hour
+
+
+# Connection settings shared by the sync and async clients. Every call goes to
+# one of two Steam hosts, so a warm keep-alive pool removes most TLS handshakes;
+# a short connect timeout fails fast when Steam is unreachable.
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+
+
+# Steam sends sporadic 429s and transient 5xx; these are worth retrying
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY = 60.0  # seconds
+
+
+# Client-side request budgets per host as (max_requests, window_seconds).
+# The store API (appdetails) has no published limit; it starts answering 429
+# for an IP after about 200 calls in 5 minutes and then blocks it for several
+# minutes, so staying under that is cheaper than retrying into the block. The
+# Web API terms allow 100k calls per key per day. STEAM_STORE_RATE_LIMIT
+# overrides the store budget as "requests/seconds", e.g. "100/300" on an IP
+# shared with other Steam tools.
+STORE_RATE_LIMIT = (200, 5 * 60)
+WEB_API_RATE_LIMIT = (100_000, 24 * 60 * 60)
+
 
 class SteamAPIError(Exception):
     """Error from Steam API."""
@@ -44,13 +95,178 @@ class SteamAPIError(Exception):
     pass
 
 
+# Shared by every SteamClient in the process so repeated syncs (e.g. /refresh
+# in chat) reuse pooled keep-alive connections instead of new TLS handshakes
+_shared_http_client: httpx.Client | None = None
+
+
+class _SlidingWindow:
+    """Thread-safe sliding-window rate limiter.
+
+    reserve() books the next free slot and returns how long the caller must
+    wait for it, so the same limiter serves both sync and async requests.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: float):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._slots: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim a request slot and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            while self._slots and self._slots[0] <= now - self.window_seconds:
+                self._slots.popleft()
+            if len(self._slots) < self.max_requests:
+                start = now
+            else:
+                start = self._slots[-self.max_requests] + self.window_seconds
+            self._slots.append(start)
+            return start - now
+
+
+def _store_rate_limit() -> tuple[int, float]:
+    """Return the store budget, honoring STEAM_STORE_RATE_LIMIT if set."""
+    value = os.getenv("STEAM_STORE_RATE_LIMIT")
+    if not value:
+        return STORE_RATE_LIMIT
+    try:
+        max_requests, window_seconds = value.split("/")
+        limit = (int(max_requests), float(window_seconds))
+    except ValueError:
+        limit = (0, 0.0)
+    if limit[0] <= 0 or limit[1] <= 0:
+        raise SteamAPIError(
+            f"Invalid STEAM_STORE_RATE_LIMIT {value!r}, expected requests/seconds like 200/300"
+        )
+    return limit
+
+
+# Shared process-wide so every SteamClient draws from the same budget. The
+# store limiter is built on first use, after the CLI has loaded its .env files.
+_store_limiter: _SlidingWindow | None = None
+_store_limiter_lock = threading.Lock()
+_web_api_limiter = _SlidingWindow(*WEB_API_RATE_LIMIT)
+
+
+def _limiter_for(url: str) -> _SlidingWindow:
+    """Return the rate limiter for the Steam host a URL points at."""
+    global _store_limiter
+    if not url.startswith(STEAM_STORE_API):
+        return _web_api_limiter
+    with _store_limiter_lock:
+        if _store_limiter is None:
+            _store_limiter = _SlidingWindow(*_store_rate_limit())
+        return _store_limiter
+
+
+# Each Steam lookup is written once as a generator (a "fetch") that yields the
+# I/O it needs and returns its result; SteamClient._drive and _drive_async then
+# perform those steps with the sync or async client. A fetch may yield:
+# - a float: seconds to sleep (rate limiting or retry backoff); it is sent None;
+# - a _Request: one GET attempt; it is sent the httpx.Response, or the
+#   request's exception is thrown into the fetch at the yield;
+# - a list of fetches: sub-lookups, run one after another by _drive and
+#   concurrently by _drive_async; it is sent their results in order. If one
+#   fails, _drive_async cancels the others and either driver throws the first
+#   error into the fetch.
+# The fetch's return value (StopIteration.value) is the driver's result.
+class _Request(NamedTuple):
+    """A single GET attempt for SteamClient._drive or _drive_async to send."""
+
+    url: str
+    kwargs: dict[str, Any]
+
+
+_T = TypeVar("_T")
+_Fetch = Generator[Any, Any, _T]
+
+
+async def _gather_or_cancel(aws: Iterable[Awaitable[_T]]) -> list[_T]:
+    """Await all awaitables concurrently; on the first failure cancel the rest.
+
+    Unlike asyncio.gather, siblings don't keep running after an error, and
+    unlike asyncio.TaskGroup the error is raised as-is rather than wrapped in
+    an ExceptionGroup, so fetches catch it just as they do under _drive.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+# Steam store release dates come as "Jan 5, 2023", "5 Jan, 2023" or "2023"
+_RELEASE_DATE_RE = re.compile(
+    r"(?P<month>[A-Za-z]{3})\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})"
+    r"|(?P<day_first>\d{1,2})\s+(?P<month_second>[A-Za-z]{3}),\s*(?P<year_dmy>\d{4})"
+    r"|(?P<year_only>\d{4})"
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+
+
+def _parse_release_date(value: str) -> datetime | None:
+    """Parse a Steam store release date, or return None if it isn't recognized."""
+    match = _RELEASE_DATE_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    if match["year_only"]:
+        return datetime(int(match["year_only"]), 1, 1)
+    if match["month"]:
+        month, day, year = match["month"], match["day"], match["year"]
+    else:
+        month, day, year = match["month_second"], match["day_first"], match["year_dmy"]
+    month_number = _MONTHS.get(month.lower())
+    if month_number is None:
+        return None
+    try:
+        return datetime(int(year), month_number, int(day))
+    except ValueError:
+        # e.g. "Feb 30, 2023"
+        return None
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.Client(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+    return _shared_http_client
+
+
 class SteamClient:
     """Client for Steam Web API."""
 
-    def __init__(self, api_key: str | None = None, steam_id: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        steam_id: str | None = None,
+        cache: ResponseCache | None = None,
+        http_client: httpx.Client | None = None,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+    ):
         self.api_key = api_key or os.getenv("STEAM_API_KEY")
         self.steam_id = steam_id or os.getenv("STEAM_ID")
-        self._http_client = httpx.Client(timeout=30.0)
+        # Callers own any client they pass in; the default is shared process-wide
+        self._http_client = http_client or _get_shared_http_client()
+        self._cache = cache
+        # Payloads this client has already fetched or loaded, so repeated lookups
+        # within a run skip both the network and the disk cache
+        self._memo: dict[tuple[str, str], CacheEntry] = {}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
 
         if not self.api_key:
             raise SteamAPIError(
@@ -58,6 +274,9 @@ class SteamClient:
                 "or pass api_key parameter. Get your key at: "
                 "https://steamcommunity.com/dev/apikey"
             )
+        # Build the store limiter up front so a bad STEAM_STORE_RATE_LIMIT is
+        # reported here rather than swallowed by a failed store lookup
+        _limiter_for(STEAM_STORE_API)
 
     def get_owned_games(self, steam_id: str | None = None, fetch_localized: bool = False) -> list[Game]:
         """Fetch all games owned by the user with playtime info.
@@ -84,30 +303,29 @@ class SteamClient:
             "include_played_free_games": True,
         }
 
-        response = self._http_client.get(url, params=params)
+        response = self._get(url, params=params)
         response.raise_for_status()
-        data = response.json()
-
-        games = []
-        for game_data in data.get("response", {}).get("games", []):
-            app_id = game_data['appid']
-            name = game_data.get("name", f"Unknown ({app_id})")
-            
+        games_data = response.json().get("response", {}).get("games", [])
+        # Release the raw body before building Games from the parsed entries
+        del response
+
+        return [self._owned_game(game_data) for game_data in games_data]
+
+    def _owned_game(self, game_data: dict) -> Game:
+        """Build a Game from one GetOwnedGames entry."""
+        app_id = game_data['appid']
+        name = game_data.get("name", f"Unknown ({app_id})")
+
+        return Game(
+            id=f"steam_{app_id}",
+            name=name,
+            platform=Platform.STEAM,
+            playtime_minutes=game_data.get("playtime_forever", 0),
+            last_played=self._unix_to_datetime(game_data.get("rtime_last_played")),
+            header_image_url=f"https://steamcdn-a.akamaihd.net/steam/apps/{app_id}/header.jpg",
             # Initialize localized_names with English name from API
-            localized_names = {"en": name}
-            
-            game = Game(
-                id=f"steam_{app_id}",
-                name=name,
-                platform=Platform.STEAM,
-                playtime_minutes=game_data.get("playtime_forever", 0),
-                last_played=self._unix_to_datetime(game_data.get("rtime_last_played")),
-                header_image_url=f"https://steamcdn-a.akamaihd.net/steam/apps/{app_id}/header.jpg",
-                localized_names=localized_names,
-            )
-            games.append(game)
-
-        return games
+            localized_names={"en": name},
+        )
 
     def enrich_game_with_localized_names(self, game: Game) -> Game:
         """Add localized names to a game.
@@ -118,12 +336,21 @@ class SteamClient:
         Returns:
             Game with localized_names populated.
         """
+        return self._drive(self._enrich_game_with_localized_names(game))
+
+    async def enrich_game_with_localized_names_async(
+        self, http: httpx.AsyncClient, game: Game
+    ) -> Game:
+        """Async variant of enrich_game_with_localized_names."""
+        return await self._drive_async(http, self._enrich_game_with_localized_names(game))
+
+    def _enrich_game_with_localized_names(self, game: Game) -> _Fetch[Game]:
         if not game.id.startswith("steam_"):
             return game
 
         app_id = int(game.id.replace("steam_", ""))
-        localized_names = self.get_localized_game_name(app_id)
-        
+        localized_names = yield from self._fetch_localized_game_name(app_id)
+
         if localized_names:
             game.localized_names.update(localized_names)
 
@@ -152,7 +379,7 @@ class SteamClient:
             "count": count,
         }
 
-        response = self._http_client.get(url, params=params)
+        response = self._get(url, params=params)
         response.raise_for_status()
         data = response.json()
 
@@ -169,7 +396,9 @@ class SteamClient:
 
         return games
 
-    def get_game_details(self, app_id: int, language: str = "english") -> dict | None:
+    def get_game_details(
+        self, app_id: int, language: str = "english", country_code: str | None = None
+    ) -> dict | None:
         """Fetch detailed game info from Steam Store API.
 
         Note: This API is rate-limited and doesn't require an API key.
@@ -177,22 +406,55 @@ class SteamClient:
         Args:
             app_id: Steam application ID.
             language: Language for localized content (e.g., 'english', 'schinese').
+            country_code: Country code for the included price_overview (e.g., 'us').
 
         Returns:
             Game details dict or None if not found.
         """
+        return self._drive(self._fetch_game_details(app_id, language, country_code))
+
+    async def get_game_details_async(
+        self,
+        http: httpx.AsyncClient,
+        app_id: int,
+        language: str = "english",
+        country_code: str | None = None,
+    ) -> dict | None:
+        """Async variant of get_game_details."""
+        return await self._drive_async(
+            http, self._fetch_game_details(app_id, language, country_code)
+        )
+
+    def _fetch_game_details(
+        self, app_id: int, language: str, country_code: str | None
+    ) -> _Fetch[dict | None]:
+        cache_key = f"{app_id}:{language}:{country_code or ''}"
+        entry = self._cache_get(DETAILS_CACHE_NAMESPACE, cache_key)
+        if entry and entry.age < self._details_ttl(country_code):
+            return entry.payload
+
         url = f"{STEAM_STORE_API}/appdetails"
         params = {"appids": app_id, "l": language}
+        if country_code:
+            params["cc"] = country_code
 
-        response = self._http_client.get(url, params=params)
-        response.raise_for_status()
+        try:
+            response = yield from self._request(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            # Serve the expired copy rather than nothing while Steam is failing
+            if entry:
+                return entry.payload
+            raise
         data = response.json()
 
         app_data = data.get(str(app_id), {})
         if not app_data.get("success"):
             return None
 
-        return app_data.get("data")
+        details = app_data.get("data")
+        self._cache_put(DETAILS_CACHE_NAMESPACE, cache_key, details, response)
+        return details
 
     def get_localized_game_name(self, app_id: int) -> dict[str, str]:
         """Fetch game name in multiple languages.
@@ -203,18 +465,27 @@ class SteamClient:
         Returns:
             Dict mapping language code to localized name.
         """
+        return self._drive(self._fetch_localized_game_name(app_id))
+
+    async def get_localized_game_name_async(
+        self, http: httpx.AsyncClient, app_id: int
+    ) -> dict[str, str]:
+        """Async variant of get_localized_game_name; fetches all languages at once."""
+        return await self._drive_async(http, self._fetch_localized_game_name(app_id))
+
+    def _fetch_localized_game_name(self, app_id: int) -> _Fetch[dict[str, str]]:
+        results = yield [
+            self._or_none(self._fetch_game_details(app_id, lang, None))
+            for lang in SUPPORTED_LANGUAGES
+        ]
+
         localized_names = {}
-        
-        for lang in SUPPORTED_LANGUAGES:
-            try:
-                details = self.get_game_details(app_id, language=lang)
-                if details and details.get("name"):
-                    # Map Steam language codes to our shorter codes
-                    lang_code = "en" if lang == "english" else "schinese"
-                    localized_names[lang_code] = details["name"]
-            except Exception:
-                pass
-        
+        for lang, details in zip(SUPPORTED_LANGUAGES, results):
+            if details and details.get("name"):
+                # Map Steam language codes to our shorter codes
+                lang_code = "en" if lang == "english" else "schinese"
+                localized_names[lang_code] = details["name"]
+
         return localized_names
 
     def enrich_game(self, game: Game) -> Game:
@@ -243,16 +514,9 @@ class SteamClient:
         # Release date
         release = details.get("release_date", {})
         if release.get("date") and not release.get("coming_soon"):
-            try:
-                # Steam uses various date formats, try common ones
-                for fmt in ["%b %d, %Y", "%d %b, %Y", "%Y"]:
-                    try:
-                        game.release_date = datetime.strptime(release["date"], fmt)
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
+            release_date = _parse_release_date(release["date"])
+            if release_date:
+                game.release_date = release_date
 
         return game
 
@@ -266,16 +530,43 @@ class SteamClient:
         Returns:
             Dict mapping api_name to achievement info (displayName, description, icon, icongray).
         """
+        return self._drive(self._fetch_achievement_schema(app_id, language))
+
+    async def get_achievement_schema_async(
+        self, http: httpx.AsyncClient, app_id: int, language: str = "english"
+    ) -> dict[str, dict]:
+        """Async variant of get_achievement_schema using a shared AsyncClient."""
+        return await self._drive_async(http, self._fetch_achievement_schema(app_id, language))
+
+    def _fetch_achievement_schema(self, app_id: int, language: str) -> _Fetch[dict[str, dict]]:
+        cache_key = f"{app_id}:{language}"
+        entry = self._cache_get(SCHEMA_CACHE_NAMESPACE, cache_key)
+        if entry and entry.age < SCHEMA_CACHE_TTL:
+            return entry.payload
+
         url = f"{STEAM_API_BASE}/ISteamUserStats/GetSchemaForGame/v2/"
         params = {"key": self.api_key, "appid": app_id, "l": language}
 
         try:
-            response = self._http_client.get(url, params=params)
+            response = yield from self._request(
+                url, params=params, headers=self._conditional_headers(entry)
+            )
+            if entry and response.status_code == 304:
+                self._cache_touch(SCHEMA_CACHE_NAMESPACE, cache_key)
+                return entry.payload
             response.raise_for_status()
             data = response.json()
         except Exception:
-            return {}
+            # Fall back to an expired copy, if any, while Steam is failing
+            return entry.payload if entry else {}
+
+        schema = self._parse_achievement_schema(data)
+        self._cache_put(SCHEMA_CACHE_NAMESPACE, cache_key, schema, response)
+        return schema
 
+    @staticmethod
+    def _parse_achievement_schema(data: dict) -> dict[str, dict]:
+        """Map api_name to achievement info from a GetSchemaForGame response."""
         schema = {}
         achievements = data.get("game", {}).get("availableGameStats", {}).get("achievements", [])
         for ach in achievements:
@@ -298,9 +589,26 @@ class SteamClient:
             Dict mapping language code to schema dict.
             Schema dict maps api_name to achievement info.
         """
+        return self._drive(self._fetch_achievement_schema_multilang(app_id))
+
+    async def get_achievement_schema_multilang_async(
+        self, http: httpx.AsyncClient, app_id: int
+    ) -> dict[str, dict[str, dict]]:
+        """Async variant of get_achievement_schema_multilang.
+
+        Fetches every language at once, so the wall time is one round trip
+        rather than one per language.
+        """
+        return await self._drive_async(http, self._fetch_achievement_schema_multilang(app_id))
+
+    def _fetch_achievement_schema_multilang(
+        self, app_id: int
+    ) -> _Fetch[dict[str, dict[str, dict]]]:
+        results = yield [
+            self._fetch_achievement_schema(app_id, lang) for lang in SUPPORTED_LANGUAGES
+        ]
         schemas = {}
-        for lang in SUPPORTED_LANGUAGES:
-            schema = self.get_achievement_schema(app_id, language=lang)
+        for lang, schema in zip(SUPPORTED_LANGUAGES, results):
             if schema:
                 # Map Steam language codes to our shorter codes
                 lang_code = "en" if lang == "english" else lang
@@ -308,7 +616,12 @@ class SteamClient:
         return schemas
 
     def get_player_achievements(
-        self, app_id: int, steam_id: str | None = None, fetch_localized: bool = True
+        self,
+        app_id: int,
+        steam_id: str | None = None,
+        fetch_localized: bool = True,
+        keep_raw: bool = False,
+        rarity_for_locked: bool = True,
     ) -> SteamProgressStats | None:
         """Fetch player's achievements for a specific game.
 
@@ -316,10 +629,47 @@ class SteamClient:
             app_id: Steam application ID.
             steam_id: Steam ID to fetch achievements for.
             fetch_localized: If True, fetch achievement names in multiple languages.
+            keep_raw: If True, attach the raw API payloads (player stats, schemas,
+                global stats) as raw_data for debugging. Off by default since
+                the schemas dominate memory for large libraries.
+            rarity_for_locked: If False, skip the global percentages request
+                when the player has unlocked nothing, since rarity would only
+                annotate locked achievements.
 
         Returns:
             SteamProgressStats or None if game has no achievements.
         """
+        return self._drive(
+            self._fetch_player_achievements(
+                app_id, steam_id, fetch_localized, keep_raw, rarity_for_locked
+            )
+        )
+
+    async def get_player_achievements_async(
+        self,
+        http: httpx.AsyncClient,
+        app_id: int,
+        steam_id: str | None = None,
+        fetch_localized: bool = True,
+        keep_raw: bool = False,
+        rarity_for_locked: bool = True,
+    ) -> SteamProgressStats | None:
+        """Async variant of get_player_achievements using a shared AsyncClient."""
+        return await self._drive_async(
+            http,
+            self._fetch_player_achievements(
+                app_id, steam_id, fetch_localized, keep_raw, rarity_for_locked
+            ),
+        )
+
+    def _fetch_player_achievements(
+        self,
+        app_id: int,
+        steam_id: str | None,
+        fetch_localized: bool,
+        keep_raw: bool,
+        rarity_for_locked: bool,
+    ) -> _Fetch[SteamProgressStats | None]:
         steam_id = steam_id or self.steam_id
         if not steam_id:
             raise SteamAPIError("Steam ID not provided.")
@@ -332,89 +682,120 @@ class SteamClient:
         }
 
         try:
-            response = self._http_client.get(url, params=params)
+            response = yield from self._request(url, params=params)
             response.raise_for_status()
             data = response.json()
         except Exception:
             return None
 
         player_stats = data.get("playerstats", {})
-        if not player_stats.get("success", False):
-            return None
-
-        achievements_data = player_stats.get("achievements", [])
-        if not achievements_data:
+        if not player_stats.get("success", False) or not player_stats.get("achievements"):
             return None
 
         # Get achievement schema for names, descriptions, icons
         if fetch_localized:
             # Fetch schemas in all supported languages
-            schemas = self.get_achievement_schema_multilang(app_id)
+            schema_fetch = self._fetch_achievement_schema_multilang(app_id)
+        else:
+            schema_fetch = self._fetch_achievement_schema(app_id, "english")
+
+        # Schemas and global percentages (for rarity info) are independent,
+        # so the async driver fetches them together
+        if self._wants_global_stats(player_stats, rarity_for_locked):
+            schemas, global_stats = yield [
+                schema_fetch,
+                self._fetch_global_achievement_stats(app_id),
+            ]
+        else:
+            [schemas] = yield [schema_fetch]
+            global_stats = {}
+
+        if fetch_localized:
             schema_en = schemas.get("en", {})
             schema_zh = schemas.get("schinese", {})
         else:
-            schema_en = self.get_achievement_schema(app_id, language="english")
-            schema_zh = {}
-
-        # Get global achievement percentages for rarity info
-        global_stats = self.get_global_achievement_stats(app_id)
-
-        # Store raw data for debugging/future use
-        raw_data = {
-            "player_stats": player_stats,
-            "schema_en": schema_en,
-            "schema_zh": schema_zh,
-            "global_stats": global_stats,
-        }
+            schema_en, schema_zh = schemas, {}
+
+        return self._build_progress_stats(
+            player_stats, schema_en, schema_zh, global_stats, keep_raw=keep_raw
+        )
+
+    @staticmethod
+    def _wants_global_stats(player_stats: dict, rarity_for_locked: bool) -> bool:
+        """Whether global percentages are worth fetching for these player stats."""
+        return rarity_for_locked or any(
+            ach.get("achieved") == 1 for ach in player_stats["achievements"]
+        )
+
+    def _build_progress_stats(
+        self,
+        player_stats: dict,
+        schema_en: dict[str, dict],
+        schema_zh: dict[str, dict],
+        global_stats: dict[str, float],
+        keep_raw: bool = False,
+    ) -> SteamProgressStats:
+        """Combine player unlock state with schema and rarity data."""
+        achievements_data = player_stats.get("achievements", [])
 
         achievements = []
         unlocked_count = 0
+        no_schema: dict = {}
+        unix_to_datetime = self._unix_to_datetime
 
         for ach_data in achievements_data:
             api_name = ach_data.get("apiname", "")
-            achieved = ach_data.get("achieved", 0) == 1
-            if achieved:
-                unlocked_count += 1
+            achieved = ach_data.get("achieved") == 1
+            unlocked_count += achieved
 
             # Get info from English schema (for icons and default name)
-            ach_schema_en = schema_en.get(api_name, {})
-            ach_schema_zh = schema_zh.get(api_name, {})
-            global_percent = global_stats.get(api_name)
-
-            # Build localized names and descriptions
-            localized_names = {}
-            localized_descriptions = {}
-            
-            if ach_schema_en.get("displayName"):
-                localized_names["en"] = ach_schema_en["displayName"]
-            if ach_schema_en.get("description"):
-                localized_descriptions["en"] = ach_schema_en["description"]
-            
-            if ach_schema_zh.get("displayName"):
-                localized_names["schinese"] = ach_schema_zh["displayName"]
-            if ach_schema_zh.get("description"):
-                localized_descriptions["schinese"] = ach_schema_zh["description"]
-
-            achievement = SteamAchievement(
-                api_name=api_name,
-                name=ach_schema_en.get("displayName"),  # Default to English
-                description=ach_schema_en.get("description"),
-                localized_names=localized_names,
-                localized_descriptions=localized_descriptions,
-                icon_url=ach_schema_en.get("icon"),
-                icon_gray_url=ach_schema_en.get("icongray"),
-                achieved=achieved,
-                unlock_time=self._unix_to_datetime(ach_data.get("unlocktime")),
-                global_percent=global_percent,
+            ach_schema_en = schema_en.get(api_name, no_schema)
+            ach_schema_zh = schema_zh.get(api_name, no_schema)
+            name_en = ach_schema_en.get("displayName")
+            description_en = ach_schema_en.get("description")
+
+            # Build localized names and descriptions, skipping missing languages
+            localized_names = {
+                lang: text
+                for lang, text in (("en", name_en), ("schinese", ach_schema_zh.get("displayName")))
+                if text
+            }
+            localized_descriptions = {
+                lang: text
+                for lang, text in (("en", description_en), ("schinese", ach_schema_zh.get("description")))
+                if text
+            }
+
+            # Fields are already the right types, so skip per-field validation
+            achievements.append(
+                SteamAchievement.model_construct(
+                    api_name=api_name,
+                    name=name_en,  # Default to English
+                    description=description_en,
+                    localized_names=localized_names,
+                    localized_descriptions=localized_descriptions,
+                    icon_url=ach_schema_en.get("icon"),
+                    icon_gray_url=ach_schema_en.get("icongray"),
+                    achieved=achieved,
+                    unlock_time=unix_to_datetime(ach_data.get("unlocktime")),
+                    global_percent=global_stats.get(api_name),
+                )
             )
-            achievements.append(achievement)
 
-        return SteamProgressStats(
+        progress = SteamProgressStats(
             total=len(achievements),
             unlocked=unlocked_count,
             achievements=achievements,
-            raw_data=raw_data,
         )
+        if keep_raw:
+            # Raw payloads for debugging only
+            progress.raw_data = {
+                "player_stats": player_stats,
+                "schema_en": schema_en,
+                "schema_zh": schema_zh,
+                "global_stats": global_stats,
+            }
+        return progress
 
     def get_global_achievement_stats(self, app_id: int) -> dict[str, float]:
         """Fetch global achievement unlock percentages.
@@ -425,48 +806,99 @@ class SteamClient:
         Returns:
             Dict mapping achievement api_name to unlock percentage.
         """
+        return self._drive(self._fetch_global_achievement_stats(app_id))
+
+    async def get_global_achievement_stats_async(
+        self, http: httpx.AsyncClient, app_id: int
+    ) -> dict[str, float]:
+        """Async variant of get_global_achievement_stats."""
+        return await self._drive_async(http, self._fetch_global_achievement_stats(app_id))
+
+    def _fetch_global_achievement_stats(self, app_id: int) -> _Fetch[dict[str, float]]:
+        cache_key = str(app_id)
+        entry = self._cache_get(GLOBAL_STATS_CACHE_NAMESPACE, cache_key)
+        if entry and entry.age < GLOBAL_STATS_CACHE_TTL:
+            return entry.payload
+
         url = f"{STEAM_API_BASE}/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v2/"
         params = {"gameid": app_id}
 
         try:
-            response = self._http_client.get(url, params=params)
+            response = yield from self._request(url, params=params)
             response.raise_for_status()
             data = response.json()
         except Exception:
-            return {}
+            # Fall back to an expired copy, if any, while Steam is failing
+            return entry.payload if entry else {}
+
+        stats = self._parse_global_achievement_stats(data)
+        self._cache_put(GLOBAL_STATS_CACHE_NAMESPACE, cache_key, stats, response)
+        return stats
 
+    @staticmethod
+    def _parse_global_achievement_stats(data: dict) -> dict[str, float]:
+        """Map api_name to unlock percentage from a global percentages response."""
         result = {}
         achievements = (
             data.get("achievementpercentages", {}).get("achievements", [])
         )
         for ach in achievements:
-            percent = ach.get("percent", 0)
-            if isinstance(percent, str):
-                try:
-                    percent = float(percent)
-                except ValueError:
-                    percent = 0.0
-            result[ach.get("name", "")] = round(percent, 2)
+            # Steam sends percentages as numbers or strings; always store floats
+            try:
+                percent = round(float(ach.get("percent", 0)), 2)
+            except (TypeError, ValueError):
+                percent = 0.0
+            result[ach.get("name", "")] = percent
 
         return result
 
     def enrich_game_with_achievements(
-        self, game: Game, steam_id: str | None = None
+        self, game: Game, steam_id: str | None = None, rarity_for_locked: bool = True
     ) -> Game:
         """Add achievement stats to a game.
 
         Args:
             game: Game object to enrich.
             steam_id: Steam ID to fetch achievements for.
+            rarity_for_locked: Passed to get_player_achievements; bulk syncs set
+                it to False to skip rarity lookups for untouched games.
 
         Returns:
             Game with progress populated.
         """
+        return self._drive(
+            self._enrich_game_with_achievements(game, steam_id, rarity_for_locked)
+        )
+
+    async def enrich_game_with_achievements_async(
+        self,
+        http: httpx.AsyncClient,
+        game: Game,
+        steam_id: str | None = None,
+        rarity_for_locked: bool = True,
+    ) -> Game:
+        """Async variant of enrich_game_with_achievements.
+
+        Lets callers enrich many games concurrently over a single AsyncClient.
+        """
+        return await self._drive_async(
+            http, self._enrich_game_with_achievements(game, steam_id, rarity_for_locked)
+        )
+
+    def _enrich_game_with_achievements(
+        self, game: Game, steam_id: str | None, rarity_for_locked: bool
+    ) -> _Fetch[Game]:
         if not game.id.startswith("steam_"):
             return game
 
         app_id = int(game.id.replace("steam_", ""))
-        progress = self.get_player_achievements(app_id, steam_id)
+        progress = yield from self._fetch_player_achievements(
+            app_id,
+            steam_id,
+            fetch_localized=True,
+            keep_raw=False,
+            rarity_for_locked=rarity_for_locked,
+        )
 
         if progress:
             game.progress = progress
@@ -493,7 +925,7 @@ class SteamClient:
         }
 
         try:
-            response = self._http_client.get(url, params=params)
+            response = self._get(url, params=params)
             response.raise_for_status()
             data = response.json()
         except Exception as e:
@@ -531,17 +963,86 @@ class SteamClient:
         }
 
         try:
-            response = self._http_client.get(url, params=params)
+            response = self._get(url, params=params)
             response.raise_for_status()
             data = response.json()
         except Exception:
             return None
 
+        return self._parse_price_info(app_id, data)
+
+    def get_price_info_batch(
+        self, app_ids: list[int], country_code: str = "us"
+    ) -> dict[int, PriceInfo]:
+        """Fetch current prices for many games in a few requests.
+
+        The price_overview filter of appdetails accepts comma-separated app IDs,
+        so prices are fetched PRICE_BATCH_SIZE apps at a time.
+
+        Args:
+            app_ids: Steam application IDs.
+            country_code: Country code for pricing (e.g., 'us', 'gb', 'cn').
+
+        Returns:
+            Dict mapping app ID to PriceInfo; apps without a price are omitted.
+        """
+        return self._drive(self._fetch_price_info_batch(app_ids, country_code))
+
+    async def get_price_info_batch_async(
+        self, http: httpx.AsyncClient, app_ids: list[int], country_code: str = "us"
+    ) -> dict[int, PriceInfo]:
+        """Async variant of get_price_info_batch; fetches the batches concurrently."""
+        return await self._drive_async(http, self._fetch_price_info_batch(app_ids, country_code))
+
+    def _fetch_price_info_batch(
+        self, app_ids: list[int], country_code: str
+    ) -> _Fetch[dict[int, PriceInfo]]:
+        batches = [
+            app_ids[start:start + PRICE_BATCH_SIZE]
+            for start in range(0, len(app_ids), PRICE_BATCH_SIZE)
+        ]
+        # A failed batch is left unpriced rather than failing the rest
+        results = yield [
+            self._or_none(self._fetch_price_overviews(batch, country_code)) for batch in batches
+        ]
+
+        prices = {}
+        for batch, data in zip(batches, results):
+            if data is None:
+                continue
+            for app_id in batch:
+                price = self._parse_price_info(app_id, data)
+                if price:
+                    prices[app_id] = price
+
+        return prices
+
+    def _fetch_price_overviews(self, app_ids: list[int], country_code: str) -> _Fetch[dict]:
+        url = f"{STEAM_STORE_API}/appdetails"
+        params = {
+            "appids": ",".join(map(str, app_ids)),
+            "cc": country_code,
+            "filters": "price_overview",
+        }
+
+        response = yield from self._request(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _parse_price_info(app_id: int, data: dict) -> PriceInfo | None:
+        """Extract PriceInfo for an app from an appdetails response."""
         app_data = data.get(str(app_id), {})
         if not app_data.get("success"):
             return None
 
-        price_data = app_data.get("data", {}).get("price_overview")
+        # Free games come back with an empty list instead of a dict
+        return SteamClient._price_from_details(app_data.get("data") or {})
+
+    @staticmethod
+    def _price_from_details(details: dict) -> PriceInfo | None:
+        """Build PriceInfo from the price_overview of an app's store details."""
+        price_data = details.get("price_overview")
         if not price_data:
             return None
 
@@ -554,53 +1055,294 @@ class SteamClient:
         )
 
     def enrich_wishlist_item(
-        self, item: WishlistItem, country_code: str = "us"
+        self, item: WishlistItem, country_code: str = "us", fetch_price: bool = True
     ) -> WishlistItem:
         """Enrich a wishlist item with game details and price.
 
         Args:
             item: WishlistItem to enrich.
             country_code: Country code for pricing.
+            fetch_price: If False, only fetch details (cached for longer) and
+                leave the price to a batched apply_wishlist_prices call.
 
         Returns:
             Enriched WishlistItem.
         """
+        return self._drive(self._enrich_wishlist_item(item, country_code, fetch_price))
+
+    async def enrich_wishlist_item_async(
+        self,
+        http: httpx.AsyncClient,
+        item: WishlistItem,
+        country_code: str = "us",
+        fetch_price: bool = True,
+    ) -> WishlistItem:
+        """Async variant of enrich_wishlist_item."""
+        return await self._drive_async(
+            http, self._enrich_wishlist_item(item, country_code, fetch_price)
+        )
+
+    def _enrich_wishlist_item(
+        self, item: WishlistItem, country_code: str, fetch_price: bool
+    ) -> _Fetch[WishlistItem]:
         try:
-            # Get game details
-            details = self.get_game_details(item.app_id)
+            # Full appdetails already carries price_overview, so one call covers both
+            details = yield from self._fetch_game_details(
+                item.app_id, "english", country_code if fetch_price else None
+            )
             if details:
-                item.name = details.get("name", item.name)
-                item.description = details.get("short_description")
-                item.genres = [g["description"] for g in details.get("genres", [])]
-                item.header_image_url = details.get("header_image")
-
-                # Release date
-                release = details.get("release_date", {})
-                if release.get("date") and not release.get("coming_soon"):
-                    for fmt in ["%b %d, %Y", "%d %b, %Y", "%Y"]:
-                        try:
-                            item.release_date = datetime.strptime(release["date"], fmt)
-                            break
-                        except ValueError:
-                            continue
-
-            # Get price info
-            item.price = self.get_price_info(item.app_id, country_code)
+                self._apply_wishlist_details(item, details)
+                if fetch_price:
+                    item.price = self._price_from_details(details)
         except Exception:
             # Silently skip enrichment failures - item will have partial data
             pass
 
         return item
 
-    def _unix_to_datetime(self, timestamp: int | None) -> datetime | None:
-        """Convert Unix timestamp to datetime."""
-        if not timestamp or timestamp == 0:
+    def apply_wishlist_prices(self, items: list[WishlistItem], country_code: str = "us") -> None:
+        """Set current prices on many wishlist items using batched price lookups.
+
+        Pair with enrich_wishlist_item(..., fetch_price=False), which then only
+        needs the longer-cached store details for each item.
+
+        Args:
+            items: WishlistItems to price in place.
+            country_code: Country code for pricing.
+        """
+        self._drive(self._apply_wishlist_prices(items, country_code))
+
+    async def apply_wishlist_prices_async(
+        self, http: httpx.AsyncClient, items: list[WishlistItem], country_code: str = "us"
+    ) -> None:
+        """Async variant of apply_wishlist_prices.
+
+        Takes (http, items), so it can run as an enrich_concurrently job
+        whose items are whole wishlists and share the job's AsyncClient.
+        """
+        await self._drive_async(http, self._apply_wishlist_prices(items, country_code))
+
+    def _apply_wishlist_prices(self, items: list[WishlistItem], country_code: str) -> _Fetch[None]:
+        prices = yield from self._fetch_price_info_batch(
+            [item.app_id for item in items], country_code
+        )
+        for item in items:
+            item.price = prices.get(item.app_id)
+
+    @staticmethod
+    def _apply_wishlist_details(item: WishlistItem, details: dict) -> None:
+        """Copy store details (name, description, genres, release date) onto a wishlist item."""
+        item.name = details.get("name", item.name)
+        item.description = details.get("short_description")
+        item.genres = [g["description"] for g in details.get("genres", [])]
+        item.header_image_url = details.get("header_image")
+
+        # Release date
+        release = details.get("release_date", {})
+        if release.get("date") and not release.get("coming_soon"):
+            release_date = _parse_release_date(release["date"])
+            if release_date:
+                item.release_date = release_date
+
+    async def enrich_concurrently(
+        self,
+        *jobs: tuple[Callable[[httpx.AsyncClient, Any], Awaitable[Any]], list],
+        on_progress: Callable[[int, Any], None] | None = None,
+        concurrency: int = ENRICH_CONCURRENCY,
+    ) -> None:
+        """Run async enrich methods over many items on one connection pool.
+
+        All jobs share a single AsyncClient and concurrency limit, so e.g.
+        achievement and wishlist enrichment overlap instead of running back
+        to back.
+
+        Args:
+            *jobs: (enrich, items) pairs, where enrich is one of the *_async
+                enrichment methods taking (http_client, item), e.g.
+                (client.enrich_game_with_achievements_async, games).
+            on_progress: Optional callback called with (job_index, item) as
+                each item finishes.
+            concurrency: Maximum number of items being enriched at once.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS) as http:
+
+            async def enrich_one(index: int, enrich, item) -> None:
+                async with semaphore:
+                    await enrich(http, item)
+                if on_progress:
+                    on_progress(index, item)
+
+            await _gather_or_cancel(
+                enrich_one(index, enrich, item)
+                for index, (enrich, items) in enumerate(jobs)
+                for item in items
+            )
+
+    def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL through _request on the shared sync client."""
+        return self._drive(self._request(url, **kwargs))
+
+    def _request(self, url: str, **kwargs) -> _Fetch[httpx.Response]:
+        """GET a URL, retrying 429/5xx responses and transport errors with backoff.
+
+        Each attempt first waits for the host's rate limiter, so bursts are
+        spread out before Steam has to reject them.
+
+        The final response is returned as-is, so callers still decide how to
+        handle a status that never recovered.
+        """
+        limiter = _limiter_for(url)
+        for attempt in range(self.max_retries + 1):
+            yield limiter.reserve()
+            try:
+                response = yield _Request(url, kwargs)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                response = None
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    return response
+            yield self._retry_delay(attempt, response)
+
+    def _drive(self, fetch: _Fetch[_T]) -> _T:
+        """Run a fetch generator to completion on the shared sync client.
+
+        See the step protocol described above _Request.
+        """
+        outcome: Any = None
+        error: Exception | None = None
+        while True:
+            try:
+                step = fetch.throw(error) if error else fetch.send(outcome)
+            except StopIteration as stop:
+                return stop.value
+            outcome, error = None, None
+            try:
+                if isinstance(step, list):
+                    outcome = [self._drive(sub) for sub in step]
+                elif isinstance(step, _Request):
+                    outcome = self._http_client.get(step.url, **step.kwargs)
+                else:
+                    time.sleep(step)
+            except Exception as e:
+                error = e
+
+    async def _drive_async(self, http: httpx.AsyncClient, fetch: _Fetch[_T]) -> _T:
+        """Async variant of _drive using a shared AsyncClient.
+
+        Sub-fetches run concurrently instead of one after another; when one
+        fails, the others are cancelled before the error is thrown in.
+        """
+        outcome: Any = None
+        error: Exception | None = None
+        while True:
+            try:
+                step = fetch.throw(error) if error else fetch.send(outcome)
+            except StopIteration as stop:
+                return stop.value
+            outcome, error = None, None
+            try:
+                if isinstance(step, list):
+                    outcome = await _gather_or_cancel(
+                        self._drive_async(http, sub) for sub in step
+                    )
+                elif isinstance(step, _Request):
+                    outcome = await http.get(step.url, **step.kwargs)
+                else:
+                    await asyncio.sleep(step)
+            except Exception as e:
+                error = e
+
+    @staticmethod
+    def _or_none(fetch: _Fetch[_T]) -> _Fetch[_T | None]:
+        """Wrap a fetch so that any failure returns None instead of raising."""
+        try:
+            return (yield from fetch)
+        except Exception:
+            return None
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Seconds to wait before the next attempt, honoring Retry-After if sent."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, float(retry_after))
+            except ValueError:
+                # HTTP-date form; fall back to our own backoff
+                pass
+        # Exponential backoff with jitter so concurrent retries don't line up
+        delay = min(MAX_RETRY_DELAY, self.base_delay * 2**attempt)
+        return delay + random.uniform(0, self.base_delay)
+
+    def _cache_get(self, namespace: str, key: str) -> CacheEntry | None:
+        """Look up a cached payload in memory, then in the disk cache if configured."""
+        entry = self._memo.get((namespace, key))
+        if entry is None and self._cache is not None:
+            entry = self._cache.get(namespace, key)
+            if entry is not None:
+                self._memo[(namespace, key)] = entry
+        return entry
+
+    @staticmethod
+    def _details_ttl(country_code: str | None) -> float:
+        """Cache lifetime for appdetails; shorter when the response carries a price."""
+        return PRICED_DETAILS_CACHE_TTL if country_code else DETAILS_CACHE_TTL
+
+    def _cache_put(self, namespace: str, key: str, payload, response: httpx.Response) -> None:
+        """Cache a non-empty payload along with the response's validators."""
+        if not payload:
+            return
+        entry = CacheEntry(
+            payload=payload,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=time.time(),
+        )
+        self._memo[(namespace, key)] = entry
+        if self._cache is not None:
+            self._cache.put(
+                namespace,
+                key,
+                payload,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+            )
+
+    def _cache_touch(self, namespace: str, key: str) -> None:
+        """Mark a cached payload as freshly revalidated (e.g. after a 304)."""
+        entry = self._memo.get((namespace, key))
+        if entry is not None:
+            entry.fetched_at = time.time()
+        if self._cache is not None:
+            self._cache.touch(namespace, key)
+
+    @staticmethod
+    def _conditional_headers(entry: CacheEntry | None) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers to revalidate a stale entry."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    @staticmethod
+    def _unix_to_datetime(timestamp: int | None) -> datetime | None:
+        """Convert Unix timestamp to a UTC datetime.
+
+        UTC skips the local timezone lookup and matches the tz-aware
+        datetimes the PSN and Xbox clients return.
+        """
+        if not timestamp:
             return None
-        return datetime.fromtimestamp(timestamp)
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
     def close(self):
-        """Close the HTTP client."""
-        self._http_client.close()
+        """Release the client (no-op: the HTTP client is shared or caller-owned)."""
+        pass
 
     def __enter__(self):
         return self
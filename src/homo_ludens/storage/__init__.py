@@ -1,5 +1,6 @@
 """Local storage for user data."""
 
+from homo_ludens.storage.cache import CacheEntry, ResponseCache
 from homo_ludens.storage.local import Storage
 
-__all__ = ["Storage"]
+__all__ = ["CacheEntry", "ResponseCache", "Storage"]
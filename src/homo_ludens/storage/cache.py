@@ -0,0 +1,131 @@
+"""SQLite-backed cache for slow-changing API responses."""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class CacheEntry(BaseModel):
+    """A cached API payload with the validators needed to revalidate it."""
+
+    payload: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the payload was fetched (or last revalidated)."""
+        return time.time() - self.fetched_at
+
+
+class ResponseCache:
+    """Persistent key/value cache for API payloads, grouped by namespace.
+
+    Each operation opens its own short-lived connection, so the cache can be
+    shared between threads and processes (WAL mode allows concurrent readers).
+
+    If the database can't be opened (read-only or corrupt file, locked disk),
+    the cache is disabled: get() misses and put()/touch() do nothing.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.enabled = True
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        namespace TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        fetched_at REAL NOT NULL,
+                        PRIMARY KEY (namespace, key)
+                    )
+                    """
+                )
+        except (OSError, sqlite3.Error):
+            # The cache is an optimization; run without one rather than fail
+            self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10.0)
+
+    def get(self, namespace: str, key: str) -> CacheEntry | None:
+        """Return the cached entry for a key, regardless of its age."""
+        if not self.enabled:
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT payload, etag, last_modified, fetched_at FROM responses "
+                    "WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        payload, etag, last_modified, fetched_at = row
+        return CacheEntry(
+            payload=json.loads(payload),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        payload: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a payload, replacing any previous entry for the key."""
+        if not self.enabled:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(namespace, key, payload, etag, last_modified, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (namespace, key, json.dumps(payload), etag, last_modified, time.time()),
+                )
+        except sqlite3.Error:
+            # The cache is an optimization; never fail the caller over it
+            pass
+
+    def touch(self, namespace: str, key: str) -> None:
+        """Mark an entry as freshly validated (e.g. after a 304 Not Modified)."""
+        if not self.enabled:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "UPDATE responses SET fetched_at = ? WHERE namespace = ? AND key = ?",
+                    (time.time(), namespace, key),
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        if not self.enabled:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
@@ -1,18 +1,84 @@
 """Local file-based storage for user data."""
 
-import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from pydantic import TypeAdapter
+
 from homo_ludens.models import (
     Conversation,
     ConversationHistory,
+    ConversationMessage,
     ConversationMetadata,
     UserProfile,
 )
+from homo_ludens.storage.cache import ResponseCache
 
 DEFAULT_DATA_DIR = Path.home() / ".homo_ludens"
 
+# Fold the append-only conversation log into the snapshot after this many messages
+CONVERSATION_COMPACT_INTERVAL = 10
+
+# conversations_index.json maps conversation ID to its listing metadata
+_CONVERSATION_INDEX_ADAPTER = TypeAdapter(dict[str, ConversationMetadata])
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on path (created if missing) for the block.
+
+    Serializes read-modify-write cycles across processes and threads.
+    """
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _conversation_metadata(conversation: Conversation) -> ConversationMetadata:
+    """Build the listing metadata for a conversation, with naive timestamps."""
+    # Ensure timestamps are naive (strip timezone if present)
+    updated_at = conversation.updated_at
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.replace(tzinfo=None)
+    created_at = conversation.created_at
+    if created_at.tzinfo is not None:
+        created_at = created_at.replace(tzinfo=None)
+    return ConversationMetadata(
+        id=conversation.id,
+        title=conversation.title,
+        created_at=created_at,
+        updated_at=updated_at,
+        message_count=len(conversation.messages),
+    )
+
 
 class Storage:
     """File-based storage for user profile and conversation history."""
@@ -23,8 +89,23 @@ class Storage:
 
         self.profile_path = self.data_dir / "profile.json"
         self.conversation_path = self.data_dir / "conversation.json"  # Legacy
+        self.conversation_log_path = self.data_dir / "conversation.jsonl"  # Legacy, append-only
         self.conversations_dir = self.data_dir / "conversations"
         self.conversations_dir.mkdir(parents=True, exist_ok=True)
+        self.conversations_index_path = self.data_dir / "conversations_index.json"
+        # Held while the index is read, updated and written back
+        self.conversations_lock_path = self.data_dir / "conversations_index.lock"
+        self.cache_dir = self.data_dir / "cache"
+        self.cache_path = self.cache_dir / "responses.db"
+        self._pending_log_messages = 0
+
+    @cached_property
+    def cache(self) -> ResponseCache:
+        """API response cache, opened on first use.
+
+        Commands that never call a platform API don't pay for opening SQLite.
+        """
+        return ResponseCache(self.cache_path)
 
     def load_profile(self) -> UserProfile:
         """Load user profile from disk, or create a new one.
@@ -34,9 +115,8 @@ class Storage:
         """
         if self.profile_path.exists():
             try:
-                with open(self.profile_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return UserProfile.model_validate(data)
+                # Validate straight from JSON; skips building an intermediate dict tree
+                return UserProfile.model_validate_json(self.profile_path.read_bytes())
             except Exception:
                 # Schema changed or corrupted file, return empty profile
                 # User will need to re-sync their library
@@ -46,59 +126,91 @@ class Storage:
     def save_profile(self, profile: UserProfile) -> None:
         """Save user profile to disk."""
         profile.updated_at = datetime.now()
-        with open(self.profile_path, "w", encoding="utf-8") as f:
-            json.dump(profile.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialize in pydantic-core rather than via model_dump + json.dump
+        _atomic_write_text(self.profile_path, profile.model_dump_json(indent=2))
 
     # =========================================================================
     # Multi-conversation support
     # =========================================================================
 
     def list_conversations(self) -> list[ConversationMetadata]:
-        """List all conversations, sorted by updated_at (newest first)."""
-        conversations = []
+        """List all conversations, sorted by updated_at (newest first).
+
+        Reads the metadata index instead of parsing every conversation file.
+        """
+        # Loading may rebuild and rewrite the index, so it needs the lock too
+        with _file_lock(self.conversations_lock_path):
+            conversations = list(self._load_conversation_index().values())
+        # Sort by updated_at descending
+        conversations.sort(key=lambda c: c.updated_at, reverse=True)
+        return conversations
+
+    def rebuild_conversation_index(self) -> dict[str, ConversationMetadata]:
+        """Rebuild the conversation index by scanning every conversation file."""
+        with _file_lock(self.conversations_lock_path):
+            return self._rebuild_conversation_index()
+
+    def _rebuild_conversation_index(self) -> dict[str, ConversationMetadata]:
+        """Rebuild the conversation index; the caller must hold the index lock."""
+        index = {}
         for file_path in self.conversations_dir.glob("*.json"):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    conv = Conversation.model_validate(data)
-                    # Ensure updated_at is naive (strip timezone if present)
-                    updated_at = conv.updated_at
-                    if updated_at.tzinfo is not None:
-                        updated_at = updated_at.replace(tzinfo=None)
-                    created_at = conv.created_at
-                    if created_at.tzinfo is not None:
-                        created_at = created_at.replace(tzinfo=None)
-                    conversations.append(
-                        ConversationMetadata(
-                            id=conv.id,
-                            title=conv.title,
-                            created_at=created_at,
-                            updated_at=updated_at,
-                            message_count=len(conv.messages),
-                        )
-                    )
-            except (json.JSONDecodeError, Exception):
+                conv = Conversation.model_validate_json(file_path.read_bytes())
+            except Exception:
                 # Skip corrupted files
                 continue
-        # Sort by updated_at descending
-        conversations.sort(key=lambda c: c.updated_at, reverse=True)
-        return conversations
+            index[file_path.stem] = _conversation_metadata(conv)
+        self._save_conversation_index(index)
+        return index
+
+    def _load_conversation_index(self) -> dict[str, ConversationMetadata]:
+        """Load the conversation index, rebuilding it if missing or out of date.
+
+        Every conversation write adds or renames a file in conversations_dir,
+        which bumps the directory's mtime, and the index is written after it.
+        A directory newer than the index therefore means files were changed
+        outside this class (e.g. by an older version) and the index is stale.
+
+        The caller must hold the index lock.
+        """
+        try:
+            index_mtime = self.conversations_index_path.stat().st_mtime_ns
+            if self.conversations_dir.stat().st_mtime_ns > index_mtime:
+                return self._rebuild_conversation_index()
+            return _CONVERSATION_INDEX_ADAPTER.validate_json(
+                self.conversations_index_path.read_bytes()
+            )
+        except Exception:
+            return self._rebuild_conversation_index()
+
+    def _save_conversation_index(self, index: dict[str, ConversationMetadata]) -> None:
+        """Write the conversation index to disk; the caller must hold the index lock."""
+        _atomic_write_text(
+            self.conversations_index_path,
+            _CONVERSATION_INDEX_ADAPTER.dump_json(index, indent=2).decode(),
+        )
 
     def get_conversation(self, conv_id: str) -> Conversation | None:
         """Load a specific conversation by ID."""
         file_path = self.conversations_dir / f"{conv_id}.json"
         if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return Conversation.model_validate(data)
+            # Validate straight from JSON; skips building an intermediate dict tree
+            return Conversation.model_validate_json(file_path.read_bytes())
         return None
 
     def save_conversation_v2(self, conversation: Conversation) -> None:
         """Save a conversation to disk."""
         conversation.updated_at = datetime.now()
         file_path = self.conversations_dir / f"{conversation.id}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(conversation.model_dump(mode="json"), f, indent=2, default=str)
+        # Hold the lock across load and save so concurrent writers can't drop
+        # each other's index updates
+        with _file_lock(self.conversations_lock_path):
+            # Load the index before touching the directory so it still counts as fresh
+            index = self._load_conversation_index()
+            _atomic_write_text(file_path, conversation.model_dump_json(indent=2))
+
+            index[conversation.id] = _conversation_metadata(conversation)
+            self._save_conversation_index(index)
 
     def create_conversation(self, title: str = "New Conversation") -> Conversation:
         """Create a new conversation and save it."""
@@ -109,10 +221,14 @@ class Storage:
     def delete_conversation(self, conv_id: str) -> bool:
         """Delete a conversation by ID. Returns True if deleted."""
         file_path = self.conversations_dir / f"{conv_id}.json"
-        if file_path.exists():
+        with _file_lock(self.conversations_lock_path):
+            if not file_path.exists():
+                return False
+            index = self._load_conversation_index()
             file_path.unlink()
+            index.pop(conv_id, None)
+            self._save_conversation_index(index)
             return True
-        return False
 
     def rename_conversation(self, conv_id: str, new_title: str) -> Conversation | None:
         """Rename a conversation. Returns updated conversation or None."""
@@ -125,13 +241,11 @@ class Storage:
 
     def migrate_legacy_conversation(self) -> Conversation | None:
         """Migrate legacy conversation.json to new format if it exists."""
-        if not self.conversation_path.exists():
+        if not self.conversation_path.exists() and not self.conversation_log_path.exists():
             return None
 
         try:
-            with open(self.conversation_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                legacy = ConversationHistory.model_validate(data)
+            legacy = self.load_conversation()
 
             if legacy.messages:
                 # Create new conversation with legacy messages
@@ -141,10 +255,10 @@ class Storage:
                 )
                 self.save_conversation_v2(conversation)
 
-                # Remove legacy file after successful migration
-                self.conversation_path.unlink()
+                # Remove legacy files after successful migration
+                self.clear_conversation()
                 return conversation
-        except (json.JSONDecodeError, Exception):
+        except Exception:
             pass
 
         return None
@@ -154,22 +268,60 @@ class Storage:
     # =========================================================================
 
     def load_conversation(self) -> ConversationHistory:
-        """Load conversation history from disk (legacy method)."""
+        """Load conversation history from disk (legacy method).
+
+        Reads the JSON snapshot, then replays any messages appended to the
+        JSONL log since the last compaction.
+        """
+        history = ConversationHistory()
         if self.conversation_path.exists():
-            with open(self.conversation_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return ConversationHistory.model_validate(data)
-        return ConversationHistory()
+            history = ConversationHistory.model_validate_json(self.conversation_path.read_bytes())
+
+        if self.conversation_log_path.exists():
+            with open(self.conversation_log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        history.messages.append(ConversationMessage.model_validate_json(line))
+            del history.messages[: -history.max_messages]
+
+        return history
 
     def save_conversation(self, history: ConversationHistory) -> None:
         """Save conversation history to disk (legacy method)."""
-        with open(self.conversation_path, "w", encoding="utf-8") as f:
-            json.dump(history.model_dump(mode="json"), f, indent=2, default=str)
+        _atomic_write_text(self.conversation_path, history.model_dump_json(indent=2))
+        # The snapshot now contains everything the log held
+        if self.conversation_log_path.exists():
+            self.conversation_log_path.unlink()
+        self._pending_log_messages = 0
+
+    def append_message(self, message: ConversationMessage) -> None:
+        """Append a single message to the conversation log (legacy method).
+
+        Unlike save_conversation this does not rewrite the whole history, so
+        each chat turn costs O(1) disk I/O. The line is fsynced so it survives
+        a crash, and the log is compacted every CONVERSATION_COMPACT_INTERVAL
+        messages so it stays short even if the process never exits cleanly.
+        """
+        with open(self.conversation_log_path, "a", encoding="utf-8") as f:
+            f.write(message.model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._pending_log_messages += 1
+        if self._pending_log_messages >= CONVERSATION_COMPACT_INTERVAL:
+            self.compact_conversation()
+
+    def compact_conversation(self) -> None:
+        """Fold the conversation log into the JSON snapshot (legacy method)."""
+        if self.conversation_log_path.exists():
+            self.save_conversation(self.load_conversation())
 
     def clear_conversation(self) -> None:
         """Clear conversation history (legacy method)."""
         if self.conversation_path.exists():
             self.conversation_path.unlink()
+        if self.conversation_log_path.exists():
+            self.conversation_log_path.unlink()
 
     def clear_all(self) -> None:
         """Clear all stored data."""
@@ -179,3 +331,7 @@ class Storage:
         # Also clear all conversations
         for file_path in self.conversations_dir.glob("*.json"):
             file_path.unlink()
+        if self.conversations_index_path.exists():
+            self.conversations_index_path.unlink()
+        if self.cache_path.exists():
+            self.cache.clear()
@@ -122,9 +122,11 @@ async def send_message(request: Request, conv_id: str, message: str = Form(...))
         # Convert Conversation to ConversationHistory-like object for the recommender
         from homo_ludens.models import ConversationHistory
 
-        history = ConversationHistory(messages=conversation.messages)
+        history = ConversationHistory(
+            messages=conversation.messages, conversation_id=conversation.id
+        )
 
-        response = recommender.chat(message, profile, history)
+        response = await recommender.achat(message, profile, history)
         
         # Handle empty response
         if not response or not response.strip():
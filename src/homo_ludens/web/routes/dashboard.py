@@ -5,8 +5,6 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request
 
-from homo_ludens.models import Platform
-
 router = APIRouter()
 
 
@@ -27,17 +25,7 @@ async def dashboard(request: Request):
     profile = storage.load_profile()
 
     # Calculate stats
-    steam_games = [g for g in profile.games if g.platform == Platform.STEAM]
-    psn_games = [g for g in profile.games if g.platform == Platform.PLAYSTATION]
-    xbox_games = [g for g in profile.games if g.platform == Platform.XBOX]
-
-    total_playtime_hours = sum(g.playtime_minutes for g in profile.games) // 60
-    played_count = len([g for g in profile.games if g.playtime_minutes > 0 or g.last_played])
-    
-    # Achievement/trophy/gamerscore stats
-    games_with_ach = [g for g in profile.games if g.progress and g.progress.total > 0]
-    total_ach = sum(g.progress.total for g in games_with_ach if g.progress)
-    unlocked_ach = sum(g.progress.unlocked for g in games_with_ach if g.progress)
+    library = profile.library_stats()
     
     # Recently played
     recent_games = [g for g in profile.games if g.last_played]
@@ -48,33 +36,33 @@ async def dashboard(request: Request):
     on_sale = [item for item in profile.wishlist if item.is_on_sale][:5]
 
     stats = {
-        "total_games": len(profile.games),
-        "steam_games": len(steam_games),
-        "psn_games": len(psn_games),
-        "xbox_games": len(xbox_games),
-        "total_playtime_hours": total_playtime_hours,
-        "played_count": played_count,
-        "unplayed_count": len(profile.games) - played_count,
-        "total_achievements": total_ach,
-        "unlocked_achievements": unlocked_ach,
-        "achievement_percent": round(unlocked_ach / total_ach * 100, 1) if total_ach > 0 else 0,
+        "total_games": library.total_games,
+        "steam_games": library.steam_games,
+        "psn_games": library.psn_games,
+        "xbox_games": library.xbox_games,
+        "total_playtime_hours": library.total_playtime_minutes // 60,
+        "played_count": library.played_games,
+        "unplayed_count": library.unplayed_games,
+        "total_achievements": library.total_achievements,
+        "unlocked_achievements": library.unlocked_achievements,
+        "achievement_percent": library.achievement_percent,
     }
 
     platforms = {
         "steam": {
             "connected": profile.steam_id is not None,
             "id": profile.steam_id,
-            "game_count": len(steam_games),
+            "game_count": library.steam_games,
         },
         "playstation": {
             "connected": profile.psn_online_id is not None,
             "id": profile.psn_online_id,
-            "game_count": len(psn_games),
+            "game_count": library.psn_games,
         },
         "xbox": {
             "connected": profile.xbox_gamertag is not None,
             "id": profile.xbox_gamertag,
-            "game_count": len(xbox_games),
+            "game_count": library.xbox_games,
         },
     }
 
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request, Query
 
-from homo_ludens.models import Platform
+from homo_ludens.models import Platform, group_games_by_platform
 
 
 def _safe_datetime(dt: datetime | None) -> datetime:
@@ -39,11 +39,12 @@ async def library(
         games = [g for g in games if g.playtime_minutes > 0 or g.last_played]
 
     # Count by platform for filter UI (count from filtered games)
+    by_platform = group_games_by_platform(games)
     platform_counts = {
         "all": len(games),
-        "steam": len([g for g in games if g.platform == Platform.STEAM]),
-        "playstation": len([g for g in games if g.platform == Platform.PLAYSTATION]),
-        "xbox": len([g for g in games if g.platform == Platform.XBOX]),
+        "steam": len(by_platform[Platform.STEAM]),
+        "playstation": len(by_platform[Platform.PLAYSTATION]),
+        "xbox": len(by_platform[Platform.XBOX]),
     }
 
     # Filter by platform
@@ -54,7 +55,7 @@ async def library(
             "xbox": Platform.XBOX,
         }
         if platform in platform_map:
-            games = [g for g in games if g.platform == platform_map[platform]]
+            games = by_platform[platform_map[platform]]
 
     # Get display language for search (map zh to schinese for game names)
     display_language = os.getenv("DISPLAY_LANGUAGE", "en")
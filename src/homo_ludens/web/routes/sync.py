@@ -1,16 +1,60 @@
 """Sync routes - sync game libraries from platforms."""
 
+import asyncio
 import os
+from functools import partial
 
 from fastapi import APIRouter, Request
 
-from homo_ludens.models import Platform
+from homo_ludens.models import Game, Platform, WishlistItem
 from homo_ludens.steam import SteamClient, SteamAPIError
 from homo_ludens.psn import PSNClient, PSNAPIError
 from homo_ludens.xbox import XboxClient, XboxAPIError
 
 router = APIRouter(prefix="/sync")
 
+# Seconds a web sync waits for Steam enrichment (achievements, localized names,
+# wishlist details and prices) before answering with what it has. The store
+# rate limit caps a large library at ~200 lookups per 5 minutes, far longer
+# than a request should hang. Enriched data lands in the disk cache, so the
+# next sync picks up where this one stopped.
+STEAM_ENRICH_TIME_BUDGET = 20.0
+STEAM_PARTIAL_NOTE = "some details are still loading, sync again to finish"
+
+
+async def _enrich_steam_library(
+    client: SteamClient, games: list[Game], wishlist_items: list[WishlistItem]
+) -> bool:
+    """Enrich Steam games and wishlist items in place, within the time budget.
+
+    Returns:
+        False if the budget ran out; items finished by then keep their data.
+    """
+    # Fetch achievements for played games (60+ min playtime)
+    played_games = [g for g in games if g.playtime_minutes >= 60]
+
+    # Fetch localized names for played games if Chinese display is selected
+    games_to_localize = []
+    if os.getenv("DISPLAY_LANGUAGE", "en") in ("zh", "schinese"):
+        # Only fetch for games with some playtime to reduce API calls
+        games_to_localize = [g for g in games if g.playtime_minutes > 0]
+
+    try:
+        async with asyncio.timeout(STEAM_ENRICH_TIME_BUDGET):
+            # Wishlist prices are looked up in batches, as one job over the whole list
+            await client.enrich_concurrently(
+                (
+                    partial(client.enrich_game_with_achievements_async, rarity_for_locked=False),
+                    played_games,
+                ),
+                (client.enrich_game_with_localized_names_async, games_to_localize),
+                (partial(client.enrich_wishlist_item_async, fetch_price=False), wishlist_items),
+                (client.apply_wishlist_prices_async, [wishlist_items]),
+            )
+    except TimeoutError:
+        return False
+    return True
+
 
 @router.post("/steam")
 async def sync_steam(request: Request):
@@ -26,26 +70,10 @@ async def sync_steam(request: Request):
         )
 
     try:
-        client = SteamClient()
+        client = SteamClient(cache=storage.cache)
         games = client.get_owned_games()
-
-        # Fetch achievements for played games (60+ min playtime)
-        played_games = [g for g in games if g.playtime_minutes >= 60]
-        for game in played_games:
-            client.enrich_game_with_achievements(game)
-
-        # Fetch localized names for played games if Chinese display is selected
-        display_language = os.getenv("DISPLAY_LANGUAGE", "en")
-        if display_language in ("zh", "schinese"):
-            # Only fetch for games with some playtime to reduce API calls
-            games_to_localize = [g for g in games if g.playtime_minutes > 0]
-            for game in games_to_localize:
-                client.enrich_game_with_localized_names(game)
-
-        # Fetch wishlist
         wishlist_items = client.get_wishlist()
-        for item in wishlist_items:
-            client.enrich_wishlist_item(item)
+        complete = await _enrich_steam_library(client, games, wishlist_items)
 
         # Save to profile
         profile = storage.load_profile()
@@ -56,16 +84,20 @@ async def sync_steam(request: Request):
         storage.save_profile(profile)
 
         games_with_achievements = [
-            g for g in games if g.progress and g.progress.total > 0
+            g for g in games if g.has_progress
         ]
         on_sale = [item for item in wishlist_items if item.is_on_sale]
 
+        message = f"Synced {len(games)} games, {len(games_with_achievements)} with achievements, {len(wishlist_items)} wishlist items ({len(on_sale)} on sale)"
+        if not complete:
+            message += f". {STEAM_PARTIAL_NOTE}"
+
         return templates.TemplateResponse(
             "partials/sync_success.html",
             {
                 "request": request,
                 "platform": "Steam",
-                "message": f"Synced {len(games)} games, {len(games_with_achievements)} with achievements, {len(wishlist_items)} wishlist items ({len(on_sale)} on sale)",
+                "message": message,
             },
         )
 
@@ -90,7 +122,7 @@ async def sync_psn(request: Request):
         )
 
     try:
-        client = PSNClient()
+        client = PSNClient(cache=storage.cache)
         games = client.get_owned_games()
 
         # Save to profile
@@ -101,7 +133,7 @@ async def sync_psn(request: Request):
         storage.save_profile(profile)
 
         games_with_trophies = [
-            g for g in games if g.progress and g.progress.total > 0
+            g for g in games if g.has_progress
         ]
 
         return templates.TemplateResponse(
@@ -145,7 +177,7 @@ async def sync_xbox(request: Request):
         storage.save_profile(profile)
 
         games_with_achievements = [
-            g for g in games if g.progress and g.progress.total > 0
+            g for g in games if g.has_progress
         ]
 
         return templates.TemplateResponse(
@@ -174,41 +206,28 @@ async def sync_all(request: Request):
     results = []
     errors = []
 
-    # Get display language preference
-    display_language = os.getenv("DISPLAY_LANGUAGE", "en")
-
     # Sync Steam if configured
     if os.getenv("STEAM_API_KEY") and os.getenv("STEAM_ID"):
         try:
-            client = SteamClient()
+            client = SteamClient(cache=storage.cache)
             games = client.get_owned_games()
-
-            played_games = [g for g in games if g.playtime_minutes >= 60]
-            for game in played_games:
-                client.enrich_game_with_achievements(game)
-
-            # Fetch localized names for played games if Chinese display is selected
-            if display_language in ("zh", "schinese"):
-                games_to_localize = [g for g in games if g.playtime_minutes > 0]
-                for game in games_to_localize:
-                    client.enrich_game_with_localized_names(game)
-
             wishlist_items = client.get_wishlist()
-            for item in wishlist_items:
-                client.enrich_wishlist_item(item)
+            complete = await _enrich_steam_library(client, games, wishlist_items)
 
             profile.games = [g for g in profile.games if g.platform != Platform.STEAM] + games
             profile.wishlist = wishlist_items
             profile.steam_id = client.steam_id
 
-            results.append(f"Steam: {len(games)} games")
+            results.append(
+                f"Steam: {len(games)} games" + ("" if complete else f" ({STEAM_PARTIAL_NOTE})")
+            )
         except SteamAPIError as e:
             errors.append(f"Steam: {e}")
 
     # Sync PSN if configured
     if os.getenv("PSN_NPSSO_TOKEN"):
         try:
-            client = PSNClient()
+            client = PSNClient(cache=storage.cache)
             games = client.get_owned_games()
 
             profile.games = [g for g in profile.games if g.platform != Platform.PLAYSTATION] + games
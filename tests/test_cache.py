@@ -0,0 +1,88 @@
+"""Tests for the SQLite response cache."""
+
+import pytest
+
+from homo_ludens.storage import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache" / "responses.db")
+
+
+def test_put_then_get(cache):
+    cache.put("schema", "440:english", {"ACH_1": {"displayName": "First"}}, etag='"abc"')
+
+    entry = cache.get("schema", "440:english")
+
+    assert entry.payload == {"ACH_1": {"displayName": "First"}}
+    assert entry.etag == '"abc"'
+    assert entry.last_modified is None
+    assert entry.age < 60
+
+
+def test_get_misses_unknown_key_and_namespace(cache):
+    cache.put("schema", "440:english", {"a": 1})
+
+    assert cache.get("schema", "440:schinese") is None
+    assert cache.get("details", "440:english") is None
+
+
+def test_entries_persist_across_instances(cache):
+    cache.put("schema", "440", [1, 2, 3])
+
+    assert ResponseCache(cache.path).get("schema", "440").payload == [1, 2, 3]
+
+
+def test_stale_entries_are_still_returned(cache, monkeypatch):
+    cache.put("stats", "440", {"ACH_1": 12.5}, last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    monkeypatch.setattr("time.time", lambda: 1e12)
+
+    entry = cache.get("stats", "440")
+
+    # Callers decide freshness from the age; stale copies back up failed requests
+    assert entry.payload == {"ACH_1": 12.5}
+    assert entry.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert entry.age > 365 * 24 * 60 * 60
+
+
+def test_touch_refreshes_age(cache, monkeypatch):
+    cache.put("schema", "440", {"a": 1})
+    later = cache.get("schema", "440").fetched_at + 3600
+    monkeypatch.setattr("time.time", lambda: later)
+    assert cache.get("schema", "440").age == pytest.approx(3600)
+
+    cache.touch("schema", "440")
+
+    assert cache.get("schema", "440").age == pytest.approx(0)
+
+
+def test_put_replaces_entry(cache):
+    cache.put("schema", "440", {"a": 1}, etag='"v1"')
+    cache.put("schema", "440", {"a": 2})
+
+    entry = cache.get("schema", "440")
+
+    assert entry.payload == {"a": 2}
+    assert entry.etag is None
+
+
+def test_clear(cache):
+    cache.put("schema", "440", {"a": 1})
+
+    cache.clear()
+
+    assert cache.get("schema", "440") is None
+
+
+def test_unusable_database_disables_cache(tmp_path):
+    path = tmp_path / "responses.db"
+    path.write_bytes(b"this is not a sqlite database" * 100)
+
+    cache = ResponseCache(path)
+    cache.put("schema", "440", {"a": 1})
+    cache.touch("schema", "440")
+    cache.clear()
+
+    assert not cache.enabled
+    assert cache.get("schema", "440") is None
@@ -0,0 +1,216 @@
+"""Tests for how the recommender builds chat requests."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from homo_ludens.models import ConversationHistory, ConversationMessage, UserProfile
+from homo_ludens.recommender import llm
+from homo_ludens.recommender.llm import (
+    HISTORY_RECENT_MESSAGES,
+    HISTORY_SUMMARY_TRIGGER,
+    PROMPT_TOKEN_BUDGET,
+    SYSTEM_PROMPT,
+    Recommender,
+    _estimate_tokens,
+)
+
+START = datetime(2024, 1, 1, 12, 0)
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that answers every call with a summary."""
+
+    def __init__(self, *replies: str | Exception):
+        self.replies = list(replies)
+        self.calls: list[dict] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+
+class FakeAsyncCompletions(FakeCompletions):
+    """Async stand-in for async_client.chat.completions."""
+
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    for name in ("AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_KEY", "OPENAI_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(llm, "_history_summaries", {})
+    monkeypatch.setattr(llm, "_clients", {})
+    llm._load_llm_config.cache_clear()
+    yield
+    llm._load_llm_config.cache_clear()
+
+
+def make_recommender(*replies: str | Exception) -> tuple[Recommender, FakeCompletions]:
+    recommender = Recommender(api_key="test-key")
+    completions = FakeCompletions(*replies)
+    recommender.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return recommender, completions
+
+
+def make_history(
+    count: int, padding: str = "", conversation_id: str | None = None
+) -> ConversationHistory:
+    return ConversationHistory(
+        conversation_id=conversation_id,
+        messages=[
+            ConversationMessage(
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"message {i}{padding}",
+                timestamp=START + timedelta(minutes=i),
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def history_part(messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Strip the system prompt, library context and current message."""
+    assert messages[0]["content"] == SYSTEM_PROMPT
+    assert messages[-1] == {"role": "user", "content": "what next?"}
+    return messages[2:-1]
+
+
+class TestHistorySummary:
+    def test_short_history_is_sent_verbatim(self):
+        recommender, completions = make_recommender()
+        history = make_history(HISTORY_SUMMARY_TRIGGER)
+
+        messages = recommender._build_messages("what next?", UserProfile(), history)
+
+        assert [m["content"] for m in history_part(messages)] == [
+            f"message {i}" for i in range(HISTORY_SUMMARY_TRIGGER)
+        ]
+        assert completions.calls == []
+
+    def test_older_turns_are_summarized(self):
+        recommender, completions = make_recommender("likes roguelikes")
+        count = HISTORY_SUMMARY_TRIGGER + 2
+        history = make_history(count)
+
+        messages = history_part(recommender._build_messages("what next?", UserProfile(), history))
+
+        assert messages[0] == {
+            "role": "system",
+            "content": "Summary of the earlier conversation:\nlikes roguelikes",
+        }
+        assert [m["content"] for m in messages[1:]] == [
+            f"message {i}" for i in range(count - HISTORY_RECENT_MESSAGES, count)
+        ]
+        [call] = completions.calls
+        prompt = call["messages"][0]["content"]
+        assert "user: message 0" in prompt
+        assert f"message {count - HISTORY_RECENT_MESSAGES}" not in prompt
+
+    def test_summary_is_reused_on_later_turns(self):
+        recommender, completions = make_recommender("likes roguelikes")
+        history = make_history(HISTORY_SUMMARY_TRIGGER + 2)
+        recommender._build_messages("what next?", UserProfile(), history)
+
+        history.messages.extend(make_history(HISTORY_SUMMARY_TRIGGER + 4).messages[-2:])
+        messages = history_part(recommender._build_messages("what next?", UserProfile(), history))
+
+        assert len(completions.calls) == 1
+        assert messages[0]["content"].endswith("likes roguelikes")
+        assert len(messages) == 1 + HISTORY_RECENT_MESSAGES + 2
+
+    def test_summary_is_extended_with_the_previous_one(self):
+        recommender, completions = make_recommender("likes roguelikes", "likes short roguelikes")
+        history = make_history(HISTORY_SUMMARY_TRIGGER + 2)
+        recommender._build_messages("what next?", UserProfile(), history)
+
+        history = make_history(2 * HISTORY_SUMMARY_TRIGGER + 2)
+        messages = history_part(recommender._build_messages("what next?", UserProfile(), history))
+
+        assert "Summary so far:\nlikes roguelikes" in completions.calls[1]["messages"][0]["content"]
+        assert messages[0]["content"].endswith("likes short roguelikes")
+
+    def test_summaries_are_kept_per_conversation(self):
+        recommender, completions = make_recommender("likes roguelikes", "likes puzzles")
+        # Same timestamps and roles, as when two chats were started in step
+        first = make_history(HISTORY_SUMMARY_TRIGGER + 2, conversation_id="first")
+        second = make_history(HISTORY_SUMMARY_TRIGGER + 2, conversation_id="second")
+
+        recommender._build_messages("what next?", UserProfile(), first)
+        messages = history_part(recommender._build_messages("what next?", UserProfile(), second))
+
+        assert len(completions.calls) == 2
+        assert messages[0]["content"].endswith("likes puzzles")
+
+    def test_async_chat_summarizes_with_the_async_client(self, monkeypatch):
+        recommender, sync_completions = make_recommender()
+        completions = FakeAsyncCompletions("likes roguelikes", "try Hades")
+        async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        monkeypatch.setattr(Recommender, "async_client", property(lambda self: async_client))
+        history = make_history(HISTORY_SUMMARY_TRIGGER + 2, conversation_id="web")
+
+        reply = asyncio.run(recommender.achat("what next?", UserProfile(), history))
+
+        assert reply == "try Hades"
+        assert sync_completions.calls == []
+        summary_call, chat_call = completions.calls
+        assert "user: message 0" in summary_call["messages"][0]["content"]
+        assert history_part(chat_call["messages"])[0]["content"].endswith("likes roguelikes")
+
+    def test_failed_summary_falls_back_to_recent_messages(self):
+        recommender, _ = make_recommender(RuntimeError("API down"))
+        history = make_history(30)
+
+        messages = history_part(recommender._build_messages("what next?", UserProfile(), history))
+
+        assert [m["content"] for m in messages] == [f"message {i}" for i in range(10, 30)]
+
+
+class TestTokenBudget:
+    def test_estimate_counts_ascii_by_four_and_cjk_by_one(self):
+        assert _estimate_tokens("abcd" * 10) == 10 + 4
+        assert _estimate_tokens("推荐一个游戏") == 6 + 4
+
+    def test_oldest_history_is_dropped_to_fit(self):
+        recommender, _ = make_recommender()
+        # About 1000 tokens each, so only a few of the eight fit in the budget
+        history = make_history(8, padding=" " + "x" * 4000)
+
+        messages = recommender._build_messages("what next?", UserProfile(), history)
+
+        kept = [int(m["content"].split()[1]) for m in history_part(messages)]
+        assert 0 < len(kept) < 8
+        assert kept == list(range(8 - len(kept), 8))
+        assert sum(_estimate_tokens(m["content"]) for m in messages) <= PROMPT_TOKEN_BUDGET
+
+    def test_huge_current_message_leaves_no_room_for_history(self):
+        recommender, _ = make_recommender()
+        huge = "y" * (4 * PROMPT_TOKEN_BUDGET)
+
+        messages = recommender._build_messages(huge, UserProfile(), make_history(4))
+
+        assert [m["role"] for m in messages] == ["system", "system", "user"]
+        assert messages[-1]["content"] == huge
+
+
+class TestSharedClients:
+    def test_recommenders_with_the_same_settings_share_clients(self):
+        first, second = Recommender(api_key="key-a"), Recommender(api_key="key-a")
+
+        assert first.client is second.client
+        assert first.async_client is second.async_client
+        assert first.client is not Recommender(api_key="key-b").client
+
+    def test_cache_is_bounded_and_not_keyed_by_api_keys(self):
+        for i in range(2 * llm._CLIENT_CACHE_SIZE):
+            Recommender(api_key=f"secret-{i}")
+
+        assert len(llm._clients) == llm._CLIENT_CACHE_SIZE
+        assert not any("secret" in key for key in llm._clients)
@@ -0,0 +1,29 @@
+"""Tests for the core game models."""
+
+import pytest
+
+from homo_ludens.models import RarityTier, percent_to_rarity_tier
+
+
+@pytest.mark.parametrize(
+    ("percent", "tier"),
+    [
+        (0.0, RarityTier.ULTRA_RARE),
+        (5.0, RarityTier.ULTRA_RARE),
+        (5.01, RarityTier.VERY_RARE),
+        (10.0, RarityTier.VERY_RARE),
+        (10.5, RarityTier.RARE),
+        (20.0, RarityTier.RARE),
+        (20.1, RarityTier.UNCOMMON),
+        (50.0, RarityTier.UNCOMMON),
+        (50.01, RarityTier.COMMON),
+        (100.0, RarityTier.COMMON),
+    ],
+)
+def test_percent_to_rarity_tier_boundaries(percent, tier):
+    # Each threshold is the inclusive upper bound of the rarer tier
+    assert percent_to_rarity_tier(percent) is tier
+
+
+def test_percent_to_rarity_tier_without_percent():
+    assert percent_to_rarity_tier(None) is None
@@ -0,0 +1,285 @@
+"""Tests for the PSN client's session handling and trophy model conversion."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import psnawp_api
+import pytest
+from psnawp_api.core.psnawp_exceptions import PSNAWPAuthenticationError, PSNAWPServerError
+from psnawp_api.models.trophies.trophy_constants import TrophyRarity, TrophyType
+
+from homo_ludens.models import RarityTier, TrophyTier
+from homo_ludens.psn import client as psn_client
+from homo_ludens.psn.client import (
+    PSNAPIError,
+    PSNClient,
+    _map_psn_rarity_to_tier,
+    _map_trophy_type_to_tier,
+    _trophy_row,
+    _trophy_row_builder,
+    _trophy_row_without_progress,
+)
+
+
+def fake_trophy(**fields) -> SimpleNamespace:
+    """Stand-in for a psnawp Trophy (no user progress)."""
+    defaults = {
+        "trophy_id": 1,
+        "trophy_name": "First Steps",
+        "trophy_detail": "Finish the tutorial",
+        "trophy_icon_url": "https://example.test/1.png",
+        "trophy_type": SimpleNamespace(name="BRONZE"),
+    }
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+def fake_trophy_with_progress(**fields) -> SimpleNamespace:
+    """Stand-in for a psnawp TrophyWithProgress."""
+    defaults = {
+        "trophy_earn_rate": "42.5",
+        "trophy_rarity": SimpleNamespace(name="COMMON"),
+        "earned": True,
+        "earned_date_time": datetime(2024, 1, 2, tzinfo=timezone.utc),
+    }
+    return fake_trophy(**{**defaults, **fields})
+
+
+@pytest.mark.parametrize(
+    ("rarity", "tier"),
+    [
+        (TrophyRarity.ULTRA_RARE, RarityTier.ULTRA_RARE),
+        (TrophyRarity.VERY_RARE, RarityTier.VERY_RARE),
+        (TrophyRarity.RARE, RarityTier.RARE),
+        (TrophyRarity.COMMON, RarityTier.COMMON),
+    ],
+)
+def test_every_psn_rarity_maps_to_its_tier(rarity, tier):
+    assert _map_psn_rarity_to_tier(rarity.name) is tier
+
+
+def test_psn_rarity_lookup_is_case_insensitive_with_common_fallback():
+    assert _map_psn_rarity_to_tier("Ultra_Rare") is RarityTier.ULTRA_RARE
+    assert _map_psn_rarity_to_tier("uncommon") is RarityTier.UNCOMMON
+    assert _map_psn_rarity_to_tier("legendary") is RarityTier.COMMON
+    assert _map_psn_rarity_to_tier(None) is None
+
+
+@pytest.mark.parametrize(
+    ("trophy_type", "tier"),
+    [
+        (TrophyType.BRONZE, TrophyTier.BRONZE),
+        (TrophyType.SILVER, TrophyTier.SILVER),
+        (TrophyType.GOLD, TrophyTier.GOLD),
+        (TrophyType.PLATINUM, TrophyTier.PLATINUM),
+    ],
+)
+def test_every_psn_trophy_type_maps_to_its_tier(trophy_type, tier):
+    assert _map_trophy_type_to_tier(trophy_type) is tier
+
+
+class TestTrophyRowBuilder:
+    def test_picks_progress_rows_for_trophies_with_progress(self):
+        assert _trophy_row_builder([fake_trophy_with_progress()]) is _trophy_row
+
+    def test_picks_plain_rows_for_trophies_without_progress(self):
+        assert _trophy_row_builder([fake_trophy()]) is _trophy_row_without_progress
+
+    def test_empty_list_uses_progress_rows(self):
+        assert _trophy_row_builder([]) is _trophy_row
+
+    def test_progress_row(self):
+        trophy = fake_trophy_with_progress()
+
+        row = _trophy_row_builder([trophy])(trophy, TrophyTier.GOLD)
+
+        assert row == {
+            "trophy_id": 1,
+            "name": "First Steps",
+            "description": "Finish the tutorial",
+            "icon_url": "https://example.test/1.png",
+            "tier": TrophyTier.GOLD,
+            "achieved": True,
+            "unlock_time": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "rarity_percent": 42.5,
+            "rarity_tier": RarityTier.COMMON,
+        }
+
+    def test_progress_row_without_psn_rarity_uses_the_earn_rate(self):
+        trophy = fake_trophy_with_progress(trophy_rarity=None, trophy_earn_rate="3.2")
+
+        row = _trophy_row(trophy, TrophyTier.BRONZE)
+
+        assert row["rarity_percent"] == 3.2
+        assert row["rarity_tier"] is RarityTier.ULTRA_RARE
+
+    def test_progress_row_tolerates_missing_values(self):
+        trophy = fake_trophy_with_progress(
+            trophy_rarity=None, trophy_earn_rate="n/a", earned=None, earned_date_time=None
+        )
+
+        row = _trophy_row(trophy, TrophyTier.BRONZE)
+
+        assert row["achieved"] is False
+        assert row["unlock_time"] is None
+        assert row["rarity_percent"] is None
+        assert row["rarity_tier"] is None
+
+    def test_plain_row_has_no_progress_fields(self):
+        trophy = fake_trophy()
+
+        row = _trophy_row_builder([trophy])(trophy, TrophyTier.BRONZE)
+
+        assert row == {
+            "trophy_id": 1,
+            "name": "First Steps",
+            "description": "Finish the tutorial",
+            "icon_url": "https://example.test/1.png",
+            "tier": TrophyTier.BRONZE,
+        }
+
+
+class FakeAuthenticator:
+    """Stand-in for psnawp's Authenticator that counts token exchanges."""
+
+    def __init__(self):
+        self.authorizations = 0
+        self.refreshes = 0
+        self.refreshing = 0
+        self.overlapped = False
+
+    def get_authorization_code(self) -> str:
+        return "code"
+
+    def fetch_access_token_from_authorization(self, code: str) -> None:
+        time.sleep(0.01)
+        self.authorizations += 1
+
+    def fetch_access_token_from_refresh(self) -> None:
+        self.refreshing += 1
+        self.overlapped |= self.refreshing > 1
+        time.sleep(0.01)
+        self.refreshes += 1
+        self.refreshing -= 1
+
+
+class FakePSNAWP:
+    """Stand-in for psnawp.PSNAWP whose me() refreshes like a real request would."""
+
+    instances: list["FakePSNAWP"] = []
+    rejected = False
+
+    def __init__(self, npsso_token: str):
+        self.authenticator = FakeAuthenticator()
+        FakePSNAWP.instances.append(self)
+
+    def me(self) -> SimpleNamespace:
+        if FakePSNAWP.rejected:
+            raise PSNAWPAuthenticationError("refresh token expired")
+        self.authenticator.fetch_access_token_from_refresh()
+        return SimpleNamespace(online_id="player", account_id="1")
+
+
+@pytest.fixture
+def fake_psnawp(monkeypatch):
+    monkeypatch.setattr(psnawp_api, "PSNAWP", FakePSNAWP)
+    monkeypatch.setattr(psn_client, "_sessions", {})
+    monkeypatch.setattr(FakePSNAWP, "instances", [])
+    monkeypatch.setattr(FakePSNAWP, "rejected", False)
+    return FakePSNAWP
+
+
+def run_in_threads(fn, count: int = 8) -> list:
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(lambda _: fn(), range(count)))
+
+
+def test_concurrent_clients_share_one_authenticated_session(fake_psnawp):
+    clients = run_in_threads(lambda: PSNClient(npsso_token="token"))
+
+    [session] = fake_psnawp.instances
+    assert session.authenticator.authorizations == 1
+    assert all(client._psnawp is session for client in clients)
+
+
+def test_token_refresh_is_serialized(fake_psnawp):
+    PSNClient(npsso_token="token")
+    [session] = fake_psnawp.instances
+
+    run_in_threads(session.authenticator.fetch_access_token_from_refresh)
+
+    assert not session.authenticator.overlapped
+
+
+def test_rejected_session_is_dropped(fake_psnawp):
+    PSNClient(npsso_token="token")
+    fake_psnawp.rejected = True
+
+    with pytest.raises(PSNAPIError, match="authentication failed"):
+        PSNClient(npsso_token="token")
+
+    assert "token" not in psn_client._sessions
+
+
+def fake_trophy_title(**fields) -> SimpleNamespace:
+    """Stand-in for a psnawp TrophyTitle."""
+    defaults = {
+        "np_communication_id": "NPWR00001_00",
+        "title_name": "Astro Bot",
+        "title_icon_url": "https://example.test/icon.png",
+        "title_platform": ["PS5"],
+        "last_updated_datetime": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        "defined_trophies": SimpleNamespace(bronze=2, silver=1, gold=0, platinum=1),
+        "earned_trophies": SimpleNamespace(bronze=1, silver=0, gold=0, platinum=0),
+        "progress": 25,
+    }
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+def client_with_titles(fake_psnawp, trophy_titles, trophies) -> PSNClient:
+    """A PSNClient whose psnawp Client serves the given titles and trophy lookup."""
+    client = PSNClient(npsso_token="token")
+    client._client = SimpleNamespace(trophy_titles=lambda: trophy_titles, trophies=trophies)
+    return client
+
+
+def test_owned_games_carry_trophy_counts_and_details(fake_psnawp):
+    def trophies(**kwargs):
+        return [fake_trophy_with_progress(), fake_trophy_with_progress(trophy_id=2, earned=False)]
+
+    [game] = client_with_titles(fake_psnawp, [fake_trophy_title()], trophies).get_owned_games()
+
+    assert game.id == "psn_NPWR00001_00"
+    assert (game.progress.total, game.progress.unlocked) == (4, 1)
+    assert [t.achieved for t in game.progress.trophies] == [True, False]
+
+
+def test_failed_trophy_fetch_keeps_counts_and_is_logged(fake_psnawp, caplog):
+    def trophies(**kwargs):
+        raise PSNAWPServerError("unavailable")
+
+    client = client_with_titles(fake_psnawp, [fake_trophy_title()], trophies)
+
+    [game] = client.get_owned_games()
+
+    assert game.progress.total == 4
+    assert game.progress.trophies == []
+    assert "NPWR00001_00" in caplog.text
+
+
+def test_unexpected_trophy_errors_are_not_swallowed(fake_psnawp):
+    def trophies(**kwargs):
+        raise AttributeError("psnawp changed shape")
+
+    client = client_with_titles(fake_psnawp, [fake_trophy_title()], trophies)
+
+    with pytest.raises(PSNAPIError, match="psnawp changed shape"):
+        client.get_owned_games()
+
+
+def test_malformed_title_data_is_rejected(fake_psnawp):
+    title = fake_trophy_title(title_icon_url=42, defined_trophies=None)
+
+    with pytest.raises(PSNAPIError):
+        client_with_titles(fake_psnawp, [title], None).get_owned_games()
@@ -0,0 +1,399 @@
+"""Tests for the Steam Web API client."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from homo_ludens.models import WishlistItem
+from homo_ludens.steam import client as steam_client
+from homo_ludens.steam.client import (
+    PRICE_BATCH_SIZE,
+    SCHEMA_CACHE_NAMESPACE,
+    SCHEMA_CACHE_TTL,
+    STEAM_API_BASE,
+    STEAM_STORE_API,
+    STORE_RATE_LIMIT,
+    SteamAPIError,
+    SteamClient,
+    _limiter_for,
+    _Request,
+    _SlidingWindow,
+)
+from homo_ludens.storage import ResponseCache
+
+SCHEMA_BODY = {
+    "game": {
+        "availableGameStats": {
+            "achievements": [
+                {"name": "ACH_1", "displayName": "First", "description": "Do it", "icon": "i"}
+            ]
+        }
+    }
+}
+SCHEMA = {"ACH_1": {"displayName": "First", "description": "Do it", "icon": "i", "icongray": None}}
+
+GLOBAL_STATS_BODY = {
+    "achievementpercentages": {"achievements": [{"name": "ACH_1", "percent": 12.5}]}
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "responses.db")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry and rate-limit waits instead of sleeping through them."""
+    recorded: list[float] = []
+
+    async def fake_async_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    monkeypatch.setattr(asyncio, "sleep", fake_async_sleep)
+    return recorded
+
+
+def make_client(handler, cache: ResponseCache | None = None) -> SteamClient:
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    return SteamClient(api_key="test-key", steam_id="1", cache=cache, http_client=http)
+
+
+class Recorder:
+    """MockTransport handler that replays canned responses and records requests.
+
+    An exception in place of a response is raised instead, like a failed
+    connection.
+    """
+
+    def __init__(self, *responses: httpx.Response | Exception):
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestSchemaCache:
+    def test_fetched_once_then_served_from_cache(self, cache):
+        handler = Recorder(httpx.Response(200, json=SCHEMA_BODY, headers={"ETag": '"v1"'}))
+
+        assert make_client(handler, cache).get_achievement_schema(440) == SCHEMA
+        assert make_client(handler, cache).get_achievement_schema(440) == SCHEMA
+
+        assert len(handler.requests) == 1
+        assert cache.get(SCHEMA_CACHE_NAMESPACE, "440:english").etag == '"v1"'
+
+    def test_stale_entry_is_revalidated_with_304(self, cache, monkeypatch):
+        cache.put(SCHEMA_CACHE_NAMESPACE, "440:english", SCHEMA, etag='"v1"')
+        later = cache.get(SCHEMA_CACHE_NAMESPACE, "440:english").fetched_at + SCHEMA_CACHE_TTL + 1
+        monkeypatch.setattr("time.time", lambda: later)
+        handler = Recorder(httpx.Response(304))
+
+        assert make_client(handler, cache).get_achievement_schema(440) == SCHEMA
+
+        [request] = handler.requests
+        assert request.headers["If-None-Match"] == '"v1"'
+        # The 304 counts as a fresh fetch, so the entry is good for another TTL
+        assert cache.get(SCHEMA_CACHE_NAMESPACE, "440:english").age == pytest.approx(0)
+
+    def test_stale_entry_is_replaced_when_changed(self, cache, monkeypatch):
+        cache.put(SCHEMA_CACHE_NAMESPACE, "440:english", {"OLD": {}}, etag='"v1"')
+        later = cache.get(SCHEMA_CACHE_NAMESPACE, "440:english").fetched_at + SCHEMA_CACHE_TTL + 1
+        monkeypatch.setattr("time.time", lambda: later)
+        handler = Recorder(httpx.Response(200, json=SCHEMA_BODY, headers={"ETag": '"v2"'}))
+
+        assert make_client(handler, cache).get_achievement_schema(440) == SCHEMA
+
+        entry = cache.get(SCHEMA_CACHE_NAMESPACE, "440:english")
+        assert entry.payload == SCHEMA
+        assert entry.etag == '"v2"'
+
+
+class TestRetries:
+    def test_transient_status_is_retried(self, sleeps):
+        handler = Recorder(httpx.Response(503), httpx.Response(200, json=GLOBAL_STATS_BODY))
+
+        assert make_client(handler).get_global_achievement_stats(440) == {"ACH_1": 12.5}
+
+        assert len(handler.requests) == 2
+        assert any(sleeps)
+
+    def test_numeric_retry_after_is_honored(self, sleeps):
+        handler = Recorder(
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json=GLOBAL_STATS_BODY),
+        )
+
+        make_client(handler).get_global_achievement_stats(440)
+
+        assert 7.0 in sleeps
+
+    def test_transport_error_is_retried(self, sleeps):
+        handler = Recorder(
+            httpx.ConnectError("connection refused"),
+            httpx.Response(200, json=GLOBAL_STATS_BODY),
+        )
+
+        assert make_client(handler).get_global_achievement_stats(440) == {"ACH_1": 12.5}
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        handler = Recorder(*(httpx.Response(503) for _ in range(4)))
+        client = make_client(handler)
+
+        assert client.get_global_achievement_stats(440) == {}
+        assert len(handler.requests) == client.max_retries + 1
+
+    def test_client_errors_are_not_retried(self, sleeps):
+        handler = Recorder(httpx.Response(404))
+
+        assert make_client(handler).get_global_achievement_stats(440) == {}
+        assert len(handler.requests) == 1
+
+    def test_async_requests_retry_too(self, sleeps):
+        handler = Recorder(
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json=GLOBAL_STATS_BODY),
+        )
+        client = make_client(Recorder())
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                return await client.get_global_achievement_stats_async(http, 440)
+
+        assert asyncio.run(fetch()) == {"ACH_1": 12.5}
+        assert 3.0 in sleeps
+
+
+class TestRateLimiting:
+    def test_window_allows_a_burst_then_waits_for_the_oldest_slot(self, monkeypatch):
+        now = 100.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        window = _SlidingWindow(2, 10)
+
+        assert window.reserve() == 0
+        now = 101.0
+        assert window.reserve() == 0
+        now = 102.0
+        # Full: the next slots open when the first two leave the window
+        assert window.reserve() == pytest.approx(8.0)
+        assert window.reserve() == pytest.approx(9.0)
+
+    def test_window_slots_expire(self, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        window = _SlidingWindow(1, 10)
+
+        assert window.reserve() == 0
+        now = 10.0
+        assert window.reserve() == 0
+
+    def test_limiter_is_chosen_by_host(self):
+        assert _limiter_for(f"{STEAM_STORE_API}/appdetails") is steam_client._store_limiter
+        assert _limiter_for(f"{STEAM_API_BASE}/ISteamApps/") is steam_client._web_api_limiter
+
+    def test_store_budget_can_be_overridden(self, monkeypatch):
+        monkeypatch.setattr(steam_client, "_store_limiter", None)
+        monkeypatch.setenv("STEAM_STORE_RATE_LIMIT", "100/600")
+
+        limiter = _limiter_for(f"{STEAM_STORE_API}/appdetails")
+
+        assert (limiter.max_requests, limiter.window_seconds) == (100, 600)
+
+    def test_store_budget_defaults_without_override(self, monkeypatch):
+        monkeypatch.setattr(steam_client, "_store_limiter", None)
+        monkeypatch.delenv("STEAM_STORE_RATE_LIMIT", raising=False)
+
+        limiter = _limiter_for(f"{STEAM_STORE_API}/appdetails")
+
+        assert (limiter.max_requests, limiter.window_seconds) == STORE_RATE_LIMIT
+
+    @pytest.mark.parametrize("value", ["200", "fast/300", "0/300", "200/-1"])
+    def test_invalid_store_budget_fails_client_creation(self, monkeypatch, value):
+        monkeypatch.setattr(steam_client, "_store_limiter", None)
+        monkeypatch.setenv("STEAM_STORE_RATE_LIMIT", value)
+
+        with pytest.raises(SteamAPIError, match="STEAM_STORE_RATE_LIMIT"):
+            make_client(Recorder())
+
+    def test_requests_wait_for_the_host_limiter(self, sleeps, monkeypatch):
+        monkeypatch.setattr(steam_client, "_web_api_limiter", _SlidingWindow(1, 30))
+        handler = Recorder(
+            httpx.Response(200, json=GLOBAL_STATS_BODY),
+            httpx.Response(200, json=GLOBAL_STATS_BODY),
+        )
+        client = make_client(handler)
+
+        client.get_global_achievement_stats(440)
+        client.get_global_achievement_stats(570)
+
+        assert max(sleeps) == pytest.approx(30, abs=1)
+
+
+def fetch_number(url: str):
+    response = yield _Request(url, {})
+    return response.json()["n"]
+
+
+def fetch_numbers(*urls: str):
+    yield 1.5
+    return (yield [fetch_number(url) for url in urls])
+
+
+def numbered(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"n": int(request.url.path.strip("/"))})
+
+
+class TestDriver:
+    def test_drive_performs_sleeps_requests_and_sub_fetches(self, sleeps):
+        client = make_client(numbered)
+
+        result = client._drive(fetch_numbers("https://example.test/1", "https://example.test/2"))
+
+        assert result == [1, 2]
+        assert sleeps == [1.5]
+
+    def test_drive_throws_request_errors_into_the_fetch(self):
+        def fetch():
+            try:
+                yield _Request("https://example.test/1", {})
+            except httpx.ConnectError:
+                return "fallback"
+
+        client = make_client(Recorder(httpx.ConnectError("connection refused")))
+
+        assert client._drive(fetch()) == "fallback"
+
+    def test_drive_async_runs_sub_fetches_concurrently(self, sleeps):
+        seen = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            if len(seen) == 2:
+                both_sent.set()
+            # Only returns once both requests are in flight
+            await asyncio.wait_for(both_sent.wait(), timeout=1)
+            return numbered(request)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                return await client._drive_async(
+                    http, fetch_numbers("https://example.test/1", "https://example.test/2")
+                )
+
+        client = make_client(Recorder())
+        both_sent = asyncio.Event()
+
+        assert asyncio.run(run()) == [1, 2]
+        assert sleeps == [1.5]
+
+    def test_drive_async_cancels_siblings_when_a_sub_fetch_fails(self):
+        cancelled = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/fail":
+                raise httpx.ConnectError("connection refused")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(request.url.path)
+                raise
+
+        def fetch():
+            try:
+                yield [
+                    fetch_number("https://example.test/slow"),
+                    fetch_number("https://example.test/fail"),
+                ]
+            except httpx.ConnectError:
+                # The original error is thrown in, not an ExceptionGroup, and
+                # only once the sibling has been stopped
+                return list(cancelled)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                return await client._drive_async(http, fetch())
+
+        client = make_client(Recorder())
+
+        assert asyncio.run(run()) == ["/slow"]
+
+    def test_enrich_concurrently_cancels_the_rest_on_failure(self):
+        cancelled = []
+
+        async def enrich(http: httpx.AsyncClient, item: str) -> None:
+            if item == "bad":
+                raise ValueError(item)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+
+        async def run():
+            with pytest.raises(ValueError, match="bad"):
+                await client.enrich_concurrently((enrich, ["a", "b"]), (enrich, ["bad"]))
+            return sorted(cancelled)
+
+        client = make_client(Recorder())
+
+        assert asyncio.run(run()) == ["a", "b"]
+
+
+def priced(request: httpx.Request) -> httpx.Response:
+    """Answer a price_overview batch with a half-price offer for every app."""
+    overview = {"currency": "USD", "initial": 1000, "final": 500, "discount_percent": 50}
+    return httpx.Response(
+        200,
+        json={
+            app_id: {"success": True, "data": {"price_overview": overview}}
+            for app_id in request.url.params["appids"].split(",")
+        },
+    )
+
+
+def wishlist(count: int) -> list[WishlistItem]:
+    return [WishlistItem(id=f"steam_{i}", app_id=i, name=f"Game {i}") for i in range(count)]
+
+
+class TestWishlistPrices:
+    def test_prices_are_fetched_in_batches(self, sleeps):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return priced(request)
+
+        items = wishlist(PRICE_BATCH_SIZE * 2 + 1)
+
+        make_client(handler).apply_wishlist_prices(items)
+
+        assert len(requests) == 3
+        assert all(item.price.final_price == 5.0 for item in items)
+
+    def test_async_pricing_shares_the_callers_client(self, sleeps):
+        failed_batch = str(PRICE_BATCH_SIZE)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["appids"].startswith(f"{failed_batch},"):
+                return httpx.Response(400)
+            return priced(request)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                await make_client(Recorder()).apply_wishlist_prices_async(http, items)
+
+        items = wishlist(PRICE_BATCH_SIZE * 3)
+
+        asyncio.run(run())
+
+        # A failed batch stays unpriced without failing the others
+        unpriced = [item.app_id for item in items if item.price is None]
+        assert unpriced == list(range(PRICE_BATCH_SIZE, 2 * PRICE_BATCH_SIZE))
@@ -0,0 +1,129 @@
+"""Tests for local file-based storage."""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from homo_ludens.models import Conversation, ConversationHistory, ConversationMessage
+from homo_ludens.storage import Storage, local
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return Storage(tmp_path)
+
+
+def _message(i: int) -> ConversationMessage:
+    return ConversationMessage(role="user" if i % 2 == 0 else "assistant", content=f"message {i}")
+
+
+class TestConversationLog:
+    def test_append_then_reload(self, storage):
+        for i in range(3):
+            storage.append_message(_message(i))
+
+        history = Storage(storage.data_dir).load_conversation()
+
+        assert [m.content for m in history.messages] == ["message 0", "message 1", "message 2"]
+        assert storage.conversation_log_path.exists()
+
+    def test_log_replays_on_top_of_snapshot(self, storage):
+        history = ConversationHistory(messages=[_message(0)])
+        storage.save_conversation(history)
+        storage.append_message(_message(1))
+
+        reloaded = storage.load_conversation()
+
+        assert [m.content for m in reloaded.messages] == ["message 0", "message 1"]
+
+    def test_compact_folds_log_into_snapshot(self, storage):
+        for i in range(3):
+            storage.append_message(_message(i))
+
+        storage.compact_conversation()
+
+        assert not storage.conversation_log_path.exists()
+        reloaded = storage.load_conversation()
+        assert [m.content for m in reloaded.messages] == ["message 0", "message 1", "message 2"]
+
+    def test_compacts_automatically_every_interval(self, storage, monkeypatch):
+        monkeypatch.setattr(local, "CONVERSATION_COMPACT_INTERVAL", 2)
+
+        storage.append_message(_message(0))
+        assert storage.conversation_log_path.exists()
+        storage.append_message(_message(1))
+
+        assert not storage.conversation_log_path.exists()
+        assert len(storage.load_conversation().messages) == 2
+
+    def test_reload_keeps_only_max_messages(self, storage):
+        storage.save_conversation(ConversationHistory(max_messages=3))
+        for i in range(5):
+            storage.append_message(_message(i))
+
+        history = storage.load_conversation()
+
+        assert [m.content for m in history.messages] == ["message 2", "message 3", "message 4"]
+
+
+class TestConversationIndex:
+    def test_save_and_delete_update_index(self, storage):
+        first = storage.create_conversation("First")
+        second = storage.create_conversation("Second")
+
+        assert [c.title for c in storage.list_conversations()] == ["Second", "First"]
+
+        assert storage.delete_conversation(first.id)
+        assert [c.id for c in storage.list_conversations()] == [second.id]
+        assert not storage.delete_conversation(first.id)
+
+    def test_rebuilt_when_directory_is_newer(self, storage):
+        storage.create_conversation("Indexed")
+
+        # Write a conversation behind the index's back, e.g. from an older version
+        outside = Conversation(title="Outside")
+        (storage.conversations_dir / f"{outside.id}.json").write_text(
+            outside.model_dump_json(), encoding="utf-8"
+        )
+        index_mtime = storage.conversations_index_path.stat().st_mtime_ns
+        newer = index_mtime + 1_000_000_000
+        os.utime(storage.conversations_dir, ns=(newer, newer))
+
+        titles = {c.title for c in storage.list_conversations()}
+
+        assert titles == {"Indexed", "Outside"}
+
+    def test_rebuilt_when_missing_or_corrupt(self, storage):
+        conversation = storage.create_conversation("Kept")
+
+        storage.conversations_index_path.unlink()
+        assert [c.id for c in storage.list_conversations()] == [conversation.id]
+
+        storage.conversations_index_path.write_text("not json", encoding="utf-8")
+        # Keep the directory older so only the parse failure triggers a rebuild
+        past = time.time_ns() - 60 * 1_000_000_000
+        os.utime(storage.conversations_dir, ns=(past, past))
+        assert [c.id for c in storage.list_conversations()] == [conversation.id]
+
+    def test_index_tracks_message_count(self, storage):
+        conversation = storage.create_conversation()
+        conversation.messages.append(_message(0))
+        storage.save_conversation_v2(conversation)
+
+        [metadata] = storage.list_conversations()
+
+        assert metadata.message_count == 1
+
+    def test_concurrent_saves_keep_every_entry(self, storage):
+        def create(i: int) -> str:
+            # Separate Storage objects, as separate processes would have
+            return Storage(storage.data_dir).create_conversation(f"Conversation {i}").id
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = set(pool.map(create, range(40)))
+
+        index = json.loads(storage.conversations_index_path.read_text(encoding="utf-8"))
+        assert set(index) == ids
@@ -0,0 +1,76 @@
+"""Tests for the web sync routes' Steam enrichment budget."""
+
+import asyncio
+
+import pytest
+
+from homo_ludens.models import Game, Platform
+from homo_ludens.web.routes import sync
+
+
+class FakeSteamClient:
+    """Stands in for SteamClient.enrich_concurrently.
+
+    Runs every job in order. With stall set, items after the first of a job
+    never finish, like lookups queued behind the store rate limiter.
+    """
+
+    def __init__(self, stall: bool = False):
+        self.stall = stall
+        self.jobs = []
+
+    async def enrich_game_with_achievements_async(self, http, game, rarity_for_locked=True):
+        game.description = "enriched"
+
+    async def enrich_game_with_localized_names_async(self, http, game):
+        pass
+
+    async def enrich_wishlist_item_async(self, http, item, fetch_price=True):
+        pass
+
+    async def apply_wishlist_prices_async(self, http, items):
+        pass
+
+    async def enrich_concurrently(self, *jobs):
+        self.jobs = jobs
+        for enrich, items in jobs:
+            for index, item in enumerate(items):
+                if index and self.stall:
+                    await asyncio.Event().wait()
+                await enrich(None, item)
+
+
+def played(app_id: int) -> Game:
+    return Game(
+        id=f"steam_{app_id}", name=f"Game {app_id}", platform=Platform.STEAM, playtime_minutes=90
+    )
+
+
+def test_enrichment_finishes_within_budget():
+    games = [played(1), played(2)]
+
+    assert asyncio.run(sync._enrich_steam_library(FakeSteamClient(), games, [])) is True
+    assert [g.description for g in games] == ["enriched", "enriched"]
+
+
+def test_enrichment_gives_up_after_budget_with_partial_results(monkeypatch):
+    monkeypatch.setattr(sync, "STEAM_ENRICH_TIME_BUDGET", 0.05)
+    games = [played(1), played(2)]
+    client = FakeSteamClient(stall=True)
+
+    assert asyncio.run(sync._enrich_steam_library(client, games, [])) is False
+    assert [g.description for g in games] == ["enriched", None]
+
+
+@pytest.mark.parametrize(("language", "localized"), [("en", 0), ("zh", 2)])
+def test_localized_names_follow_display_language(monkeypatch, language, localized):
+    monkeypatch.setenv("DISPLAY_LANGUAGE", language)
+    client = FakeSteamClient()
+    brief = Game(id="steam_2", name="Brief", platform=Platform.STEAM, playtime_minutes=5)
+    games = [played(1), brief]
+
+    asyncio.run(sync._enrich_steam_library(client, games, []))
+
+    played_job, localize_job, _, _ = client.jobs
+    assert len(played_job[1]) == 1
+    assert len(localize_job[1]) == localized